@@ -7,175 +7,367 @@ Run multiple experiments with different configurations and compare results.
 
 import sys
 import os
+import json
+import sqlite3
 from pathlib import Path
 from datetime import datetime
-import json
 import concurrent.futures
+import multiprocessing
+import queue
 import threading
 from typing import List, Dict, Any
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from berghain import BerghainAPI, GameRunner, BerghainVisualizer
+from berghain import BerghainAPI, GameRunner
 from berghain.strategies import Scenario1Strategy
+from berghain.utils import write_json
 from dotenv import load_dotenv
 from experiment_config import get_config, list_configs
 
 
+EXECUTORS = {
+    "process": concurrent.futures.ProcessPoolExecutor,
+    "thread": concurrent.futures.ThreadPoolExecutor,
+}
+
+
+# One row per experiment in the batch results database
+RESULTS_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    experiment_id TEXT PRIMARY KEY,
+    scenario INTEGER,
+    config_name TEXT,
+    game_id TEXT,
+    strategy_name TEXT,
+    total_steps INTEGER,
+    admitted_count INTEGER,
+    rejected_count INTEGER,
+    success INTEGER,
+    error TEXT,
+    constraints TEXT,
+    config TEXT,
+    output_dir TEXT,
+    timestamp TEXT
+)
+"""
+
+# Number of dashboards buffered before a burst write when every version is kept
+MAX_BUFFERED_DASHBOARDS = 5
+
+# Admitted people between refreshes of an overridden live dashboard, so it is
+# refreshed about five times as the venue (1000 people) fills up
+LIVE_DASHBOARD_ADMITTED_STEP = 200
+
+# Per-process pools of reusable API clients (HTTP session) and visualizers.
+# A worker returns its instances when an experiment finishes, so the next
+# experiment scheduled on the same worker skips their construction.
+_API_POOL = queue.SimpleQueue()
+_VISUALIZER_POOL = queue.SimpleQueue()
+
+
+def _acquire(pool, factory):
+    """Take an instance from a pool, creating a new one if the pool is empty."""
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return factory()
+
+
+def _gil_enabled():
+    """Check whether the running interpreter has the GIL enabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+def _log_consumer(log_queue):
+    """Write queued log messages to stdout from a single thread.
+    
+    Workers never contend on stdout: they only put messages on the queue.
+    The consumer stops when it receives None.
+    
+    Args:
+        log_queue: Queue of log messages
+    """
+    write = sys.stdout.write
+    while True:
+        message = log_queue.get()
+        if message is None:
+            break
+        write(message + "\n")
+        # Flush once the backlog is drained rather than after every message
+        if log_queue.empty():
+            sys.stdout.flush()
+    sys.stdout.flush()
+
+
+def _write_dashboards(dashboards):
+    """Serialize and write a batch of buffered dashboards.
+    
+    The pages share a single plotly.min.js written next to them on the first
+    write, instead of each embedding the bundle.
+    
+    Args:
+        dashboards: List of (path, figure dict) pairs
+    """
+    from berghain.visualization import write_dashboard_html
+    
+    for path, dashboard in dashboards:
+        # Snapshots come from a validated figure, no need to validate again
+        write_dashboard_html(dashboard, path, validate=False)
+
+
+def _save_checkpoint(summary, exp_dir, total_steps):
+    """Save a lightweight JSON progress checkpoint for an experiment.
+    
+    Args:
+        summary: Current game summary of the experiment
+        exp_dir: Experiment output directory
+        total_steps: Steps completed so far
+    """
+    checkpoint = {
+        key: value for key, value in summary.items()
+        if key not in ("people_history", "current_stats")
+    }
+    checkpoint["total_steps"] = total_steps
+    write_json(checkpoint, exp_dir / "checkpoint.json")
+
+
+def run_single_experiment(scenario, config_name, experiment_id, output_dir, log_queue,
+                          override_dashboards=True, dashboard_every=10,
+                          final_dashboard_only=True):
+    """Run a single experiment with given configuration.
+    
+    Defined at module level so it can be pickled and run in a worker process.
+    Progress messages are put on a log queue drained by the parent's printer
+    thread. Dashboards are refreshed in place on the calling thread (they read
+    the live runner state), snapshotted, buffered, and then
+    serialized and written in bursts by a single background writer thread, so
+    the decision loop does not wait on Plotly's HTML export. When dashboards
+    are overridden, the live file is only rendered and written every
+    LIVE_DASHBOARD_ADMITTED_STEP admissions, as intermediate renders would be
+    overwritten anyway.
+    
+    Args:
+        scenario: Scenario number
+        config_name: Configuration name
+        experiment_id: Unique experiment identifier
+        output_dir: Directory to save all outputs
+        log_queue: Queue receiving progress messages
+        override_dashboards: Whether to overwrite existing dashboard files
+        dashboard_every: Number of save intervals between intermediate dashboards
+        final_dashboard_only: Skip intermediate dashboards and only write JSON
+            checkpoints until the final dashboard
+        
+    Returns:
+        Dictionary with experiment results
+    """
+    log = log_queue.put
+    log(f"\n🧪 Starting experiment {experiment_id}\n"
+        f"   Scenario: {scenario}\n"
+        f"   Config: {config_name}\n" +
+        "-" * 40)
+    
+    # Load environment (worker processes may not inherit the parent's)
+    load_dotenv()
+    
+    # Get configuration
+    config = get_config(config_name)
+    
+    # Create strategy (each worker needs its own instances)
+    strategy = Scenario1Strategy(**config.strategy_params)
+    
+    # Borrow an API client and visualizer for this experiment
+    api = _acquire(_API_POOL, BerghainAPI)
+    # Imported here so the parent process, which renders nothing, never loads plotly
+    from berghain import BerghainVisualizer
+    visualizer = _acquire(_VISUALIZER_POOL, BerghainVisualizer)
+    
+    # Create game runner
+    runner = GameRunner(api, strategy)
+    
+    # Single writer thread keeps dashboard writes ordered
+    writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    pending_writes = []
+    
+    try:
+        # Start game
+        game_state = runner.start_game(scenario)
+        game_id = game_state.game_id
+        
+        log(f"🎯 {experiment_id}: Game ID: {game_id}")
+        
+        # Create experiment-specific output directory
+        exp_dir = Path(output_dir) / f"{experiment_id}_{game_id}"
+        exp_dir.mkdir(exist_ok=True)
+        
+        # Loop invariants, bound to locals once
+        max_steps = config.max_steps
+        steps_per_save = config.steps_per_save
+        step = runner.step
+        create_dashboard = visualizer.create_live_dashboard
+        update_dashboard = visualizer.update_live_dashboard
+        submit_write = writer.submit
+        
+        # Run experiment
+        total_steps = 0
+        save_count = 0
+        last_dashboard_step = 0
+        dashboard = None
+        summary = None
+        dashboard_interval = steps_per_save * max(1, dashboard_every)
+        dashboard_filename = f"{game_id}_dashboard.html"  # Override same file
+        buffered = []
+        # Admitted count from which the overridden live file is next refreshed.
+        # Games end long before max_steps, so follow how full the venue is.
+        next_refresh_admitted = LIVE_DASHBOARD_ADMITTED_STEP
+        
+        while total_steps < max_steps and not runner.game_completed:
+            # Run steps
+            steps_to_run = min(steps_per_save, max_steps - total_steps)
+            
+            step_records = step(steps_to_run, show_progress=False)
+            total_steps += len(step_records)
+            
+            # One summary per chunk, shared by the checkpoint and the log line
+            summary = runner.get_game_summary()
+            
+            # Rebuilding the dashboard walks the whole history, so only do it
+            # every few intervals and write a cheap checkpoint in between. An
+            # overridden file only keeps the latest render, so it is only
+            # rendered when it will be written.
+            dashboard_due = (not final_dashboard_only and
+                             total_steps - last_dashboard_step >= dashboard_interval)
+            if dashboard_due and override_dashboards:
+                dashboard_due = summary['admitted_count'] >= next_refresh_admitted
+            if dashboard_due:
+                # Snapshot the refreshed figure, it is mutated by the next refresh
+                dashboard = update_dashboard(runner).to_dict()
+                last_dashboard_step = total_steps
+                if override_dashboards:
+                    # Save dashboard (override previous)
+                    pending_writes.append(submit_write(
+                        _write_dashboards, [(exp_dir / dashboard_filename, dashboard)]))
+                    next_refresh_admitted = ((summary['admitted_count'] // LIVE_DASHBOARD_ADMITTED_STEP + 1)
+                                             * LIVE_DASHBOARD_ADMITTED_STEP)
+                else:
+                    # Traditional separate files
+                    buffered.append((exp_dir / f"dashboard_{total_steps:04d}.html", dashboard))
+                    save_count += 1
+                    if save_count % MAX_BUFFERED_DASHBOARDS == 0:
+                        pending_writes.append(submit_write(_write_dashboards, buffered))
+                        buffered = []
+            else:
+                _save_checkpoint(summary, exp_dir, total_steps)
+            
+            log(f"   {experiment_id}: Steps {total_steps}, "
+                f"Admitted: {summary['admitted_count']}")
+            
+            if runner.game_completed:
+                break
+        
+        # Get final results (the state has not changed since the last chunk)
+        if summary is None:
+            summary = runner.get_game_summary()
+        
+        # Save final dashboard, reusing the last one if it already shows the final state
+        if dashboard is not None and last_dashboard_step == total_steps:
+            final_dashboard = dashboard
+        else:
+            final_dashboard = create_dashboard(runner).to_dict()
+        if override_dashboards:
+            # Overwrite the main dashboard file with final state
+            buffered = [(exp_dir / dashboard_filename, final_dashboard)]
+        else:
+            buffered.append((exp_dir / "final_dashboard.html", final_dashboard))
+        pending_writes.append(writer.submit(_write_dashboards, buffered))
+        
+        # Wait for all dashboard writes, surfacing any write error
+        for write in pending_writes:
+            write.result()
+        
+        # Create result record
+        result = {
+            "experiment_id": experiment_id,
+            "scenario": scenario,
+            "config_name": config_name,
+            "game_id": game_id,
+            "strategy_name": summary["strategy"],
+            "total_steps": total_steps,
+            "admitted_count": summary["admitted_count"],
+            "rejected_count": summary["rejected_count"],
+            "success": summary["success"],
+            "constraints": summary["constraints"],
+            "config": config.to_dict(),
+            "output_dir": str(exp_dir),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        log(f"✅ Experiment {experiment_id} completed\n"
+            f"   Result: {'SUCCESS' if result['success'] else 'FAILED'}\n"
+            f"   Admitted: {result['admitted_count']}/1000\n"
+            f"   Rejected: {result['rejected_count']}")
+        
+        return result
+        
+    except Exception as e:
+        log(f"❌ Experiment {experiment_id} failed: {e}")
+        return {
+            "experiment_id": experiment_id,
+            "scenario": scenario,
+            "config_name": config_name,
+            "error": str(e),
+            "success": False,
+            "timestamp": datetime.now().isoformat()
+        }
+    finally:
+        writer.shutdown(wait=True)
+        _API_POOL.put(api)
+        _VISUALIZER_POOL.put(visualizer)
+
+
 class BatchExperimentRunner:
     """Run multiple experiments and compare results."""
     
-    def __init__(self, output_dir="batch_experiments", max_workers=None, override_dashboards=True):
+    def __init__(self, output_dir="batch_experiments", max_workers=None, override_dashboards=True,
+                 dashboard_every=10, executor="process", final_dashboard_only=True,
+                 pretty_json=False):
         """Initialize batch runner.
         
         Args:
             output_dir: Directory to save all outputs
             max_workers: Maximum number of parallel workers (None = auto)
             override_dashboards: Whether to overwrite existing dashboard files
+            dashboard_every: Number of save intervals between intermediate dashboards
+                (a lightweight JSON checkpoint is written at the other intervals)
+            executor: "process" for a process pool, or "thread" for a thread pool.
+                Threads only run in parallel on a free-threaded interpreter
+                (python3.13t, or PYTHON_GIL=0).
+            final_dashboard_only: Skip intermediate dashboards and only write JSON
+                checkpoints until the final dashboard
+            pretty_json: Indent JSON outputs (slower, for debugging)
         """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Executor must be one of {list(EXECUTORS)}")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.max_workers = max_workers
         self.override_dashboards = override_dashboards
+        self.dashboard_every = max(1, dashboard_every)
+        self.executor = executor
+        self.final_dashboard_only = final_dashboard_only
+        self.pretty_json = pretty_json
         
         # Load environment
         load_dotenv()
         
-        # Results storage (thread-safe)
+        # Results storage (only touched from the main process)
         self.results = []
-        self.results_lock = threading.Lock()
-    
-    def run_single_experiment(self, scenario, config_name, experiment_id):
-        """Run a single experiment with given configuration.
-        
-        Args:
-            scenario: Scenario number
-            config_name: Configuration name
-            experiment_id: Unique experiment identifier
-            
-        Returns:
-            Dictionary with experiment results
-        """
-        # Thread-safe printing
-        with self.results_lock:
-            print(f"\n🧪 Starting experiment {experiment_id}")
-            print(f"   Scenario: {scenario}")
-            print(f"   Config: {config_name}")
-            print("-" * 40)
-        
-        # Get configuration
-        config = get_config(config_name)
-        
-        # Create strategy (each thread needs its own instances)
-        strategy = Scenario1Strategy(**config["strategy_params"])
-        
-        # Create API client and visualizer for this thread
-        api = BerghainAPI()
-        visualizer = BerghainVisualizer()
-        
-        # Create game runner
-        runner = GameRunner(api, strategy)
-        
-        try:
-            # Start game
-            game_state = runner.start_game(scenario)
-            game_id = game_state.game_id
-            
-            with self.results_lock:
-                print(f"🎯 Game ID: {game_id}")
-            
-            # Create experiment-specific output directory
-            exp_dir = self.output_dir / f"{experiment_id}_{game_id}"
-            exp_dir.mkdir(exist_ok=True)
-            
-            # Run experiment
-            total_steps = 0
-            save_count = 0
-            dashboard_filename = f"{game_id}_dashboard.html"  # Override same file
-            
-            while total_steps < config["max_steps"] and not runner.game_completed:
-                # Run steps
-                steps_to_run = min(config["steps_per_save"], 
-                                 config["max_steps"] - total_steps)
-                
-                step_records = runner.step(steps_to_run, show_progress=False)
-                total_steps += len(step_records)
-                
-                # Save dashboard (override previous)
-                if self.override_dashboards:
-                    dashboard = visualizer.create_live_dashboard(runner)
-                    dashboard.write_html(str(exp_dir / dashboard_filename))
-                
-                else:
-                    # Traditional separate files
-                    dashboard = visualizer.create_live_dashboard(runner)
-                    filename = f"dashboard_{total_steps:04d}.html"
-                    dashboard.write_html(str(exp_dir / filename))
-                
-                save_count += 1
-                
-                with self.results_lock:
-                    print(f"   {experiment_id}: Steps {total_steps}, "
-                          f"Admitted: {runner.get_game_summary()['admitted_count']}")
-                
-                if runner.game_completed:
-                    break
-            
-            # Get final results
-            summary = runner.get_game_summary()
-            
-            # Save final dashboard
-            final_dashboard = visualizer.create_live_dashboard(runner)
-            if self.override_dashboards:
-                # Overwrite the main dashboard file with final state
-                final_dashboard.write_html(str(exp_dir / dashboard_filename))
-            else:
-                final_dashboard.write_html(str(exp_dir / "final_dashboard.html"))
-            
-            # Create result record
-            result = {
-                "experiment_id": experiment_id,
-                "scenario": scenario,
-                "config_name": config_name,
-                "game_id": game_id,
-                "strategy_name": summary["strategy"],
-                "total_steps": total_steps,
-                "admitted_count": summary["admitted_count"],
-                "rejected_count": summary["rejected_count"],
-                "success": summary["success"],
-                "constraints": summary["constraints"],
-                "config": config,
-                "output_dir": str(exp_dir),
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Save experiment metadata
-            with open(exp_dir / "experiment_metadata.json", "w") as f:
-                json.dump(result, f, indent=2)
-            
-            with self.results_lock:
-                print(f"✅ Experiment {experiment_id} completed")
-                print(f"   Result: {'SUCCESS' if result['success'] else 'FAILED'}")
-                print(f"   Admitted: {result['admitted_count']}/1000")
-                print(f"   Rejected: {result['rejected_count']}")
-            
-            return result
-            
-        except Exception as e:
-            with self.results_lock:
-                print(f"❌ Experiment {experiment_id} failed: {e}")
-            return {
-                "experiment_id": experiment_id,
-                "scenario": scenario,
-                "config_name": config_name,
-                "error": str(e),
-                "success": False,
-                "timestamp": datetime.now().isoformat()
-            }
     
     def run_batch(self, scenarios, configs):
-        """Run batch of experiments in parallel.
+        """Run batch of experiments in parallel worker processes.
         
         Args:
             scenarios: List of scenario numbers
@@ -194,42 +386,88 @@ class BatchExperimentRunner:
                 experiment_id = f"exp_{experiment_count:03d}_{config_name}_s{scenario}"
                 experiments.append((scenario, config_name, experiment_id))
         
+        # Submit the longest experiments first so none of them starts last and
+        # stretches the batch (longest-processing-time-first scheduling). Every
+        # step is a server round-trip, so the length is the number of steps
+        # measured by a previous batch, with the save overhead as a tie-breaker.
+        step_estimates = self._load_step_estimates()
+        experiments.sort(
+            key=lambda e: (step_estimates.get((e[0], e[1]), step_estimates.get(e[0], 0.0)),
+                           get_config(e[1]).cost_hint),
+            reverse=True
+        )
+        
         print(f"📊 Total experiments: {len(experiments)}")
-        print(f"🔧 Max workers: {self.max_workers or 'auto'}")
+        print(f"🔧 Max workers: {self.max_workers or 'auto'} ({self.executor}s)")
         print(f"📁 Override dashboards: {self.override_dashboards}")
+        if self.final_dashboard_only:
+            print("🖼️  Dashboards: final only")
+        else:
+            print(f"🖼️  Dashboard every: {self.dashboard_every} saves")
         print("=" * 60)
         
-        # Run experiments in parallel
+        if self.executor == "thread" and _gil_enabled():
+            print("⚠️  The GIL is enabled: thread workers will not run strategy code in parallel")
+        
+        # Run experiments in parallel. Strategy and dashboard code is pure Python
+        # and holds the GIL, so real parallelism needs either separate processes
+        # or a free-threaded interpreter. Workers share no mutable state and
+        # results are only collected here, in the main thread.
+        # Single printer thread for all progress output. Process workers reach
+        # it through a manager queue proxy, thread workers through a SimpleQueue.
+        manager = multiprocessing.Manager() if self.executor == "process" else None
+        log_queue = manager.Queue() if manager is not None else queue.SimpleQueue()
+        printer = threading.Thread(target=_log_consumer, args=(log_queue,), daemon=True)
+        printer.start()
+        log = log_queue.put
+        
+        # Results are only appended by this (main) thread as futures complete,
+        # so a plain list and counter need no lock; workers never touch them.
         results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all experiments
-            future_to_exp = {
-                executor.submit(self.run_single_experiment, scenario, config_name, experiment_id): 
-                (scenario, config_name, experiment_id)
-                for scenario, config_name, experiment_id in experiments
-            }
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_exp):
-                scenario, config_name, experiment_id = future_to_exp[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    with self.results_lock:
-                        print(f"🎯 Completed {len(results)}/{len(experiments)} experiments")
+        completed = 0
+        # The printer thread is already running, and forking a multi-threaded
+        # process can deadlock the child (e.g. on the stdout lock), so process
+        # workers are started from a single-threaded forkserver instead
+        pool_options = {}
+        if self.executor == "process":
+            pool_options["mp_context"] = multiprocessing.get_context("forkserver")
+        try:
+            with EXECUTORS[self.executor](max_workers=self.max_workers, **pool_options) as executor:
+                # Submit all experiments
+                future_to_exp = {
+                    executor.submit(run_single_experiment, scenario, config_name, experiment_id,
+                                    str(self.output_dir), log_queue, self.override_dashboards,
+                                    self.dashboard_every, self.final_dashboard_only): 
+                    (scenario, config_name, experiment_id)
+                    for scenario, config_name, experiment_id in experiments
+                }
+                
+                # Collect results as they complete
+                for future in concurrent.futures.as_completed(future_to_exp):
+                    scenario, config_name, experiment_id = future_to_exp[future]
+                    try:
+                        result = future.result()
+                        results.append(result)
+                        completed += 1
                         
-                except Exception as exc:
-                    with self.results_lock:
-                        print(f"❌ Experiment {experiment_id} generated an exception: {exc}")
-                    results.append({
-                        "experiment_id": experiment_id,
-                        "scenario": scenario,
-                        "config_name": config_name,
-                        "error": str(exc),
-                        "success": False,
-                        "timestamp": datetime.now().isoformat()
-                    })
+                        log(f"🎯 Completed {completed}/{len(experiments)} experiments")
+                            
+                    except Exception as exc:
+                        log(f"❌ Experiment {experiment_id} generated an exception: {exc}")
+                        results.append({
+                            "experiment_id": experiment_id,
+                            "scenario": scenario,
+                            "config_name": config_name,
+                            "error": str(exc),
+                            "success": False,
+                            "timestamp": datetime.now().isoformat()
+                        })
+        finally:
+            # Stop the printer once everything queued so far is written
+            log_queue.put(None)
+            printer.join()
+            if manager is not None:
+                manager.shutdown()
         
         # Store results
         self.results = results
@@ -238,12 +476,79 @@ class BatchExperimentRunner:
         self._save_batch_results()
         self._print_batch_summary()
     
+    def _load_step_estimates(self):
+        """Estimate the number of steps of each experiment from a previous batch.
+        
+        Reads batch_results.json left in the output directory by an earlier run
+        and averages the number of steps per scenario and configuration, and per
+        scenario alone for configurations that were not run.
+        
+        Returns:
+            Dictionary mapping (scenario, config name) and scenario number to a
+            mean number of steps (empty if no history)
+        """
+        results_file = self.output_dir / "batch_results.json"
+        if not results_file.exists():
+            return {}
+        
+        try:
+            with open(results_file) as f:
+                previous_results = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        steps_by_key = {}
+        for result in previous_results:
+            if result.get("total_steps"):
+                steps = result["total_steps"]
+                steps_by_key.setdefault(result["scenario"], []).append(steps)
+                steps_by_key.setdefault((result["scenario"], result.get("config_name")), []).append(steps)
+        
+        return {key: sum(values) / len(values) for key, values in steps_by_key.items()}
+    
     def _save_batch_results(self):
-        """Save batch results to file."""
+        """Save batch results to file and to the SQLite results database.
+        
+        All experiment records are written in one bulk insert at the end of the
+        batch, instead of one metadata file per experiment directory.
+        """
         results_file = self.output_dir / "batch_results.json"
-        with open(results_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        write_json(self.results, results_file, pretty=self.pretty_json)
         print(f"💾 Batch results saved to: {results_file}")
+        
+        rows = [
+            (
+                r["experiment_id"],
+                r["scenario"],
+                r["config_name"],
+                r.get("game_id"),
+                r.get("strategy_name"),
+                r.get("total_steps"),
+                r.get("admitted_count"),
+                r.get("rejected_count"),
+                bool(r.get("success", False)),
+                r.get("error"),
+                json.dumps(r.get("constraints")),
+                json.dumps(r.get("config")),
+                r.get("output_dir"),
+                r["timestamp"]
+            )
+            for r in self.results
+        ]
+        db_file = self.output_dir / "results.sqlite"
+        conn = sqlite3.connect(db_file)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(RESULTS_TABLE_SCHEMA)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO experiments VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        finally:
+            conn.close()
+        print(f"🗄️  Experiment records saved to: {db_file}")
     
     def _print_batch_summary(self):
         """Print summary of batch results."""
@@ -291,8 +596,17 @@ def main():
                        help="Output directory")
     parser.add_argument("--max-workers", type=int, default=None,
                        help="Maximum number of parallel workers (default: auto)")
+    parser.add_argument("--executor", choices=list(EXECUTORS), default="process",
+                       help="Worker pool type; use 'thread' on a free-threaded (no-GIL) Python")
+    parser.add_argument("--pretty-json", action="store_true",
+                       help="Indent JSON outputs (slower, for debugging)")
     parser.add_argument("--no-override", action="store_true",
                        help="Don't override dashboard files (save all versions)")
+    parser.add_argument("--final-dashboard-only", action=argparse.BooleanOptionalAction, default=True,
+                       help="Only render the final dashboard, writing JSON checkpoints in between")
+    parser.add_argument("--dashboard-every", type=int, default=10,
+                       help="Save intervals between intermediate dashboards, "
+                            "with --no-final-dashboard-only (default: 10)")
     
     args = parser.parse_args()
     
@@ -306,13 +620,20 @@ def main():
     print(f"Configurations: {args.configs}")
     print(f"Output directory: {args.output_dir}")
     print(f"Max workers: {args.max_workers or 'auto'}")
+    print(f"Executor: {args.executor}")
     print(f"Override dashboards: {not args.no_override}")
+    print(f"Final dashboard only: {args.final_dashboard_only}")
+    print(f"Dashboard every: {args.dashboard_every} saves")
     
     # Create and run batch
     batch_runner = BatchExperimentRunner(
         output_dir=args.output_dir,
         max_workers=args.max_workers,
-        override_dashboards=not args.no_override
+        override_dashboards=not args.no_override,
+        dashboard_every=args.dashboard_every,
+        executor=args.executor,
+        final_dashboard_only=args.final_dashboard_only,
+        pretty_json=args.pretty_json
     )
     batch_runner.run_batch(args.scenarios, args.configs)
 
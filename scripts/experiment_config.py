@@ -4,82 +4,122 @@ Experiment Configuration
 Default configurations for different types of experiments.
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class ExperimentConfig:
+    """Immutable experiment configuration."""
+    steps_per_save: int
+    max_steps: int
+    strategy_params: Mapping[str, float]
+    
+    def __post_init__(self):
+        # Freeze the strategy parameters so shared configs cannot be mutated
+        object.__setattr__(self, "strategy_params", MappingProxyType(dict(self.strategy_params)))
+    
+    def __reduce__(self):
+        # mappingproxy cannot be pickled; rebuild from a plain dict instead
+        return (ExperimentConfig, (self.steps_per_save, self.max_steps, dict(self.strategy_params)))
+    
+    @property
+    def cost_hint(self) -> float:
+        """Relative save overhead of an experiment: its number of save chunks at max_steps.
+        
+        This is not a runtime estimate, as games end long before max_steps.
+        It only orders experiments whose length was not measured by a previous batch.
+        """
+        return self.max_steps / self.steps_per_save
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the configuration to a JSON-serializable dictionary."""
+        return {
+            "steps_per_save": self.steps_per_save,
+            "max_steps": self.max_steps,
+            "strategy_params": dict(self.strategy_params)
+        }
+
+
 # Default experiment configurations
-EXPERIMENT_CONFIGS = {
-    "quick": {
-        "steps_per_save": 50,
-        "max_steps": 100000,
-        "strategy_params": {
+EXPERIMENT_CONFIGS = MappingProxyType({
+    "quick": ExperimentConfig(
+        steps_per_save=50,
+        max_steps=100000,
+        strategy_params={
             "initial_tolerance": 0.20,
             "final_tolerance": 0.02,
             "strictness_start": 0.10
         }
-    },
+    ),
     
-    "standard": {
-        "steps_per_save": 100,
-        "max_steps": 100000,
-        "strategy_params": {
+    "standard": ExperimentConfig(
+        steps_per_save=100,
+        max_steps=100000,
+        strategy_params={
             "initial_tolerance": 0.20,
             "final_tolerance": 0.02,
             "strictness_start": 0.10
         }
-    },
+    ),
     
-    "full": {
-        "steps_per_save": 200,
-        "max_steps": 100000,
-        "strategy_params": {
+    "full": ExperimentConfig(
+        steps_per_save=200,
+        max_steps=100000,
+        strategy_params={
             "initial_tolerance": 0.20,
             "final_tolerance": 0.02,
             "strictness_start": 0.10
         }
-    },
+    ),
     
-    "aggressive": {
-        "steps_per_save": 100,
-        "max_steps": 100000,
-        "strategy_params": {
+    "aggressive": ExperimentConfig(
+        steps_per_save=100,
+        max_steps=100000,
+        strategy_params={
             "initial_tolerance": 0.15,
             "final_tolerance": 0.01,
             "strictness_start": 0.05
         }
-    },
+    ),
     
-    "conservative": {
-        "steps_per_save": 100,
-        "max_steps": 100000,
-        "strategy_params": {
+    "conservative": ExperimentConfig(
+        steps_per_save=100,
+        max_steps=100000,
+        strategy_params={
             "initial_tolerance": 0.30,
             "final_tolerance": 0.05,
             "strictness_start": 0.20
         }
-    }
-}
+    )
+})
 
 def get_config(config_name):
     """Get experiment configuration by name.
     
+    Configurations are immutable, so the shared instance is returned directly.
+    
     Args:
         config_name: Name of the configuration
         
     Returns:
-        Configuration dictionary
+        ExperimentConfig instance
     """
     if config_name not in EXPERIMENT_CONFIGS:
         print(f"Available configurations: {list(EXPERIMENT_CONFIGS.keys())}")
         raise ValueError(f"Unknown configuration: {config_name}")
     
-    return EXPERIMENT_CONFIGS[config_name].copy()
+    return EXPERIMENT_CONFIGS[config_name]
 
 def list_configs():
     """List all available configurations."""
     print("Available experiment configurations:")
     for name, config in EXPERIMENT_CONFIGS.items():
-        strategy = config["strategy_params"]
+        strategy = config.strategy_params
         print(f"  {name}:")
-        print(f"    Steps per save: {config['steps_per_save']}")
-        print(f"    Max steps: {config['max_steps']}")
+        print(f"    Steps per save: {config.steps_per_save}")
+        print(f"    Max steps: {config.max_steps}")
         print(f"    Tolerance: {strategy['initial_tolerance']:.0%} → {strategy['final_tolerance']:.0%}")
         print(f"    Strictness start: {strategy['strictness_start']:.0%}")
         print()
@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from berghain import BerghainAPI, GameRunner, BerghainVisualizer
+from berghain.visualization import write_dashboard_html
 from berghain.strategies import Scenario1Strategy
 from dotenv import load_dotenv
 
@@ -72,7 +73,7 @@ def run_quick_experiment(scenario=1, total_steps=10000, save_interval=100):
             dashboard = visualizer.create_live_dashboard(runner)
             filename = f"{game_id}_{steps_completed:04d}steps.html"
             filepath = output_dir / filename
-            dashboard.write_html(str(filepath))
+            write_dashboard_html(dashboard, filepath)
             print(f"💾 Saved: {filename}")
             save_count += 1
             
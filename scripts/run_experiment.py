@@ -9,6 +9,7 @@ dashboard visualizations at regular intervals with the game_id as filename.
 import sys
 import os
 import argparse
+import json
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +17,7 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from berghain import BerghainAPI, GameRunner, BerghainVisualizer
+from berghain.visualization import write_dashboard_html
 from berghain.strategies import Scenario1Strategy
 from dotenv import load_dotenv
 import plotly.io as pio
@@ -25,21 +27,29 @@ class ExperimentRunner:
     """Automated experiment runner for the Berghain puzzle."""
     
     def __init__(self, scenario=1, steps_per_save=100, max_steps=2000, 
-                 output_dir="experiment_outputs", strategy_params=None):
+                 output_dir="experiment_outputs", strategy_params=None, dashboard_every=10,
+                 final_dashboard_only=True):
         """Initialize the experiment runner.
         
         Args:
             scenario: Scenario number (1, 2, or 3)
-            steps_per_save: Number of steps between dashboard saves
+            steps_per_save: Number of steps between progress saves
             max_steps: Maximum number of steps to run
             output_dir: Directory to save outputs
             strategy_params: Dictionary of strategy parameters
+            dashboard_every: Number of saves between intermediate dashboards
+                (a lightweight JSON checkpoint is written at the other saves)
+            final_dashboard_only: Skip the initial and intermediate dashboards and
+                only write JSON checkpoints until the final dashboard
         """
         self.scenario = scenario
         self.steps_per_save = steps_per_save
         self.max_steps = max_steps
         self.output_dir = Path(output_dir)
         self.strategy_params = strategy_params or {}
+        self.dashboard_every = max(1, dashboard_every)
+        self.final_dashboard_only = final_dashboard_only
+        self._last_dashboard_step = 0
         
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
@@ -96,15 +106,20 @@ class ExperimentRunner:
             print(f"❌ Error starting game: {e}")
             return False
     
-    def save_dashboard(self, step_count):
+    def save_dashboard(self, step_count, final=False):
         """Save the current dashboard to file.
         
         Args:
             step_count: Current step count for filename
+            final: Whether this is the final dashboard of the experiment
         """
         try:
-            # Create dashboard
-            dashboard = self.visualizer.create_live_dashboard(self.runner)
+            # Build the initial and final dashboards from scratch, and only
+            # refresh the trace data of the previous one in between
+            if step_count == 0 or final:
+                dashboard = self.visualizer.create_live_dashboard(self.runner)
+            else:
+                dashboard = self.visualizer.update_live_dashboard(self.runner)
             
             # Create filename
             timestamp = datetime.now().strftime("%H%M%S")
@@ -112,18 +127,38 @@ class ExperimentRunner:
             filepath = self.output_dir / filename
             
             # Save dashboard
-            dashboard.write_html(str(filepath))
+            write_dashboard_html(dashboard, filepath)
             print(f"💾 Dashboard saved: {filename}")
             
             # Also save constraint percentage chart separately
             constraint_fig = self.visualizer.plot_constraint_percentages_over_time(self.runner)
             constraint_filename = f"{self.game_id}_{step_count:04d}steps_constraints_{timestamp}.html"
             constraint_filepath = self.output_dir / constraint_filename
-            constraint_fig.write_html(str(constraint_filepath))
+            write_dashboard_html(constraint_fig, constraint_filepath)
             print(f"📊 Constraint chart saved: {constraint_filename}")
             
         except Exception as e:
             print(f"❌ Error saving dashboard: {e}")
+        
+        self._last_dashboard_step = step_count
+    
+    def save_checkpoint(self, step_count, game_summary):
+        """Save a lightweight JSON progress checkpoint.
+        
+        Args:
+            step_count: Current step count
+            game_summary: Game summary from the runner
+        """
+        checkpoint = {
+            key: value for key, value in game_summary.items()
+            if key not in ("people_history", "current_stats")
+        }
+        checkpoint["total_steps"] = step_count
+        try:
+            with open(self.output_dir / f"{self.game_id}_checkpoint.json", "w") as f:
+                json.dump(checkpoint, f)
+        except Exception as e:
+            print(f"❌ Error saving checkpoint: {e}")
     
     def run_experiment(self):
         """Run the complete experiment."""
@@ -131,7 +166,11 @@ class ExperimentRunner:
             return False
         
         print(f"\n🚀 Running experiment...")
-        print(f"📈 Will save dashboards every {self.steps_per_save} steps")
+        print(f"📈 Will save progress every {self.steps_per_save} steps")
+        if self.final_dashboard_only:
+            print("🖼️  Will save the dashboard at the end only")
+        else:
+            print(f"🖼️  Will save dashboards every {self.steps_per_save * self.dashboard_every} steps")
         print(f"🎯 Maximum steps: {self.max_steps}")
         print("=" * 60)
         
@@ -139,8 +178,9 @@ class ExperimentRunner:
         save_count = 0
         
         # Save initial state
-        self.save_dashboard(0)
-        save_count += 1
+        if not self.final_dashboard_only:
+            self.save_dashboard(0)
+            save_count += 1
         
         try:
             while total_steps < self.max_steps and not self.runner.game_completed:
@@ -170,15 +210,25 @@ class ExperimentRunner:
                     status = "✅" if constraint['satisfied'] else "⚠️"
                     print(f"   {status} {attr}: {actual}/{required} ({percentage:.1f}%)")
                 
-                # Save dashboard
-                self.save_dashboard(total_steps)
-                save_count += 1
+                # Rebuilding the dashboard walks the whole history, so only do it
+                # every few saves and write a cheap checkpoint in between
+                if (not self.final_dashboard_only and
+                        total_steps - self._last_dashboard_step >= self.steps_per_save * self.dashboard_every):
+                    self.save_dashboard(total_steps)
+                    save_count += 1
+                else:
+                    self.save_checkpoint(total_steps, game_summary)
                 
                 # Check if game is complete
                 if self.runner.game_completed:
                     print(f"\n🏁 Game completed after {total_steps} steps!")
                     break
             
+            # Always finish with a dashboard of the final state
+            if self.final_dashboard_only or self._last_dashboard_step != total_steps:
+                self.save_dashboard(total_steps, final=True)
+                save_count += 1
+            
             # Final summary
             self._print_final_summary(total_steps, save_count)
             return True
@@ -217,10 +267,12 @@ class ExperimentRunner:
             status = "✅" if constraint['satisfied'] else "❌"
             print(f"  {status} {attr}: {actual}/{required} ({percentage:.1f}%)")
         
-        # List saved files
+        # List saved files, scandir avoids a stat per directory entry
         print(f"\n📄 Files saved:")
-        for file in sorted(self.output_dir.glob(f"{self.game_id}*")):
-            print(f"  - {file.name}")
+        with os.scandir(self.output_dir) as entries:
+            saved_files = sorted(entry.name for entry in entries if entry.name.startswith(self.game_id))
+        for name in saved_files:
+            print(f"  - {name}")
 
 
 def main():
@@ -234,6 +286,11 @@ def main():
                        help="Maximum number of steps to run")
     parser.add_argument("--output-dir", type=str, default="experiment_outputs",
                        help="Directory to save outputs")
+    parser.add_argument("--final-dashboard-only", action=argparse.BooleanOptionalAction, default=True,
+                       help="Only save the final dashboard, writing JSON checkpoints in between")
+    parser.add_argument("--dashboard-every", type=int, default=10,
+                       help="Number of saves between intermediate dashboards, "
+                            "with --no-final-dashboard-only")
     
     # Strategy parameters
     parser.add_argument("--initial-tolerance", type=float, default=0.20,
@@ -258,6 +315,8 @@ def main():
     print(f"   Scenario: {args.scenario}")
     print(f"   Steps per save: {args.steps_per_save}")
     print(f"   Max steps: {args.max_steps}")
+    print(f"   Final dashboard only: {args.final_dashboard_only}")
+    print(f"   Dashboard every: {args.dashboard_every} saves")
     print(f"   Output directory: {args.output_dir}")
     print(f"   Strategy params: {strategy_params}")
     
@@ -268,7 +327,9 @@ def main():
             steps_per_save=args.steps_per_save,
             max_steps=args.max_steps,
             output_dir=args.output_dir,
-            strategy_params=strategy_params
+            strategy_params=strategy_params,
+            dashboard_every=args.dashboard_every,
+            final_dashboard_only=args.final_dashboard_only
         )
         
         success = experiment.run_experiment()
@@ -4,10 +4,17 @@ __version__ = "0.1.0"
 
 from .game_runner import GameRunner
 from .api import BerghainAPI
-from .visualization import BerghainVisualizer
 
 __all__ = [
     'GameRunner',
     'BerghainAPI',
     'BerghainVisualizer',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Import the visualizer (and plotly) only when it is first used
+    if name == 'BerghainVisualizer':
+        from .visualization import BerghainVisualizer
+        return BerghainVisualizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,36 +2,52 @@
 
 import os
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Sequence
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Person:
-    """Represents a person with attributes."""
+    """Represents a person with attributes.
+    
+    attributes is shared with the PersonRecord of the person and must not be
+    mutated. attribute_bits encodes the same attributes as a bitmask: bit i is set when
+    the attribute at index i of BerghainAPI.attribute_index is True. Constraint
+    attributes come first, so bit i matches the i-th game constraint. It has no
+    default so that it cannot silently disagree with attributes; build it with
+    BerghainAPI._encode_attributes().
+    """
     person_index: int
     attributes: Dict[str, bool]
+    attribute_bits: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """Represents a game constraint."""
     attribute: str
     min_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeStatistics:
     """Represents attribute statistics for the game."""
     relative_frequencies: Dict[str, float]
     correlations: Dict[str, Dict[str, float]]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class GameState:
     """Represents the current state of the game."""
     game_id: str
@@ -39,26 +55,99 @@ class GameState:
     admitted_count: int
     rejected_count: int
     next_person: Optional[Person]
-    constraints: List[Constraint]
+    constraints: Sequence[Constraint]
     attribute_statistics: AttributeStatistics
 
 
+# Shared placeholders for the fields decide-and-next responses do not carry
+# (constraints and statistics are only provided at game start)
+_EMPTY_CONSTRAINTS: tuple = ()
+_EMPTY_STATS = AttributeStatistics({}, {})
+
+
+def _parse_json(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class BerghainAPI:
     """API client for interacting with the Berghain puzzle game."""
     
-    def __init__(self, base_url: str = "https://berghain.challenges.listenlabs.ai", player_id: Optional[str] = None):
+    def __init__(self, base_url: str = "https://berghain.challenges.listenlabs.ai", player_id: Optional[str] = None,
+                 timeout: float = 10.0, max_retries: int = 5, retry_backoff: float = 0.2,
+                 warmup: bool = True):
         """Initialize the API client.
         
         Args:
             base_url: Base URL for the API
             player_id: Player ID, if not provided will try to load from environment
+            timeout: Timeout in seconds for each request
+            max_retries: Number of retries of a new-game request failing with a
+                transient gateway error (502, 503, 504). Decisions are only
+                retried when the connection could not be opened, as the server
+                may already have applied a decision whose response was lost
+            retry_backoff: Backoff factor between retries in seconds (0 retries
+                immediately, for low-latency connections)
+            warmup: Open the connection to the server right away, so the DNS
+                lookup and TLS handshake are done before the first game request
         """
         self.base_url = base_url.rstrip('/')
         self.player_id = player_id or os.getenv('PLAYER_ID')
+        self.timeout = timeout
         self.session = requests.Session()
         
+        # Bit position of each attribute in Person.attribute_bits, set per game
+        self.attribute_index: Dict[str, int] = {}
+        
+        # Endpoint URLs, built once rather than on every request
+        self._new_game_url = f"{self.base_url}/new-game"
+        self._decide_and_next_url = f"{self.base_url}/decide-and-next"
+        
+        # Keep the connection to the game server alive across all decisions and
+        # retry transient gateway errors instead of failing the whole game.
+        # raise_on_status=False leaves exhausted retries to raise_for_status(),
+        # so callers still get an HTTPError rather than a RetryError.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=retry_backoff,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False
+            )
+        )
+        self.session.mount(self.base_url, adapter)
+        
+        # decide-and-next changes the game state: a read timeout or gateway error
+        # may come after the server applied the decision, so only retry failed
+        # connections there (the longer mount prefix takes precedence)
+        decide_adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=max_retries,
+                connect=max_retries,
+                read=0,
+                status=0,
+                backoff_factor=retry_backoff,
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False
+            )
+        )
+        self.session.mount(self._decide_and_next_url, decide_adapter)
+        
         if not self.player_id:
             raise ValueError("Player ID must be provided or set in PLAYER_ID environment variable")
+        
+        if warmup:
+            try:
+                self.session.head(self.base_url, timeout=2.0)
+            except requests.RequestException:
+                pass  # Best effort, the first game request connects anyway
     
     def new_game(self, scenario: int) -> GameState:
         """Create a new game.
@@ -72,21 +161,25 @@ class BerghainAPI:
         if scenario not in [1, 2, 3]:
             raise ValueError("Scenario must be 1, 2, or 3")
             
-        url = f"{self.base_url}/new-game"
         params = {
             'scenario': scenario,
             'playerId': self.player_id
         }
         
-        response = self.session.get(url, params=params)
+        response = self.session.get(self._new_game_url, params=params, timeout=self.timeout)
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         
-        # Parse constraints
+        # Parse constraints, merging any repeated attribute into its first
+        # constraint (keeping the strictest minimum) so that every constraint
+        # has its own bit below
+        min_counts: Dict[str, int] = {}
+        for c in data['constraints']:
+            min_counts[c['attribute']] = max(min_counts.get(c['attribute'], 0), c['minCount'])
         constraints = [
-            Constraint(attribute=c['attribute'], min_count=c['minCount'])
-            for c in data['constraints']
+            Constraint(attribute=attr, min_count=min_count)
+            for attr, min_count in min_counts.items()
         ]
         
         # Parse attribute statistics
@@ -95,6 +188,12 @@ class BerghainAPI:
             correlations=data['attributeStatistics']['correlations']
         )
         
+        # Number attributes for the bitmask encoding, constraint attributes first
+        # (unique, so bit i is the attribute of constraint i)
+        self.attribute_index = {c.attribute: i for i, c in enumerate(constraints)}
+        for attr in attr_stats.relative_frequencies:
+            self.attribute_index.setdefault(attr, len(self.attribute_index))
+        
         return GameState(
             game_id=data['gameId'],
             status='running',
@@ -116,26 +215,28 @@ class BerghainAPI:
         Returns:
             Updated GameState
         """
-        url = f"{self.base_url}/decide-and-next"
         params = {
             'gameId': game_id,
             'personIndex': person_index
         }
         
         if accept is not None:
-            params['accept'] = str(accept).lower()
+            params['accept'] = 'true' if accept else 'false'
         
-        response = self.session.get(url, params=params)
+        response = self.session.get(self._decide_and_next_url, params=params, timeout=self.timeout)
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         
-        # Parse next person if present
+        # Parse next person if present (straight from the wire dict, one lookup each)
         next_person = None
-        if data.get('nextPerson'):
+        next_person_data = data.get('nextPerson')
+        if next_person_data:
+            attributes = next_person_data['attributes']
             next_person = Person(
-                person_index=data['nextPerson']['personIndex'],
-                attributes=data['nextPerson']['attributes']
+                person_index=next_person_data['personIndex'],
+                attributes=attributes,
+                attribute_bits=self._encode_attributes(attributes)
             )
         
         return GameState(
@@ -144,10 +245,31 @@ class BerghainAPI:
             admitted_count=data.get('admittedCount', 0),
             rejected_count=data.get('rejectedCount', 0),
             next_person=next_person,
-            constraints=[],  # Constraints are only provided at game start
-            attribute_statistics=AttributeStatistics({}, {})  # Stats are only provided at game start
+            constraints=_EMPTY_CONSTRAINTS,
+            attribute_statistics=_EMPTY_STATS
         )
     
+    def _encode_attributes(self, attributes: Dict[str, bool]) -> int:
+        """Encode a person's attributes as a bitmask.
+        
+        Attributes missing from the game statistics get the next free bit.
+        
+        Args:
+            attributes: Attribute values of the person
+            
+        Returns:
+            Bitmask with the bits of the person's True attributes set
+        """
+        attribute_index = self.attribute_index
+        bits = 0
+        for attr, value in attributes.items():
+            if value:
+                index = attribute_index.get(attr)
+                if index is None:
+                    index = attribute_index[attr] = len(attribute_index)
+                bits |= 1 << index
+        return bits
+    
     def get_game_info(self, game_state: GameState) -> Dict[str, Any]:
         """Get formatted game information for display.
         
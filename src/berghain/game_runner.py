@@ -3,19 +3,26 @@
 from typing import Dict, List, Any, Optional, Tuple
 import time
 from dataclasses import dataclass
+import numpy as np
 
 # Import from parent package
 from .api import BerghainAPI, Person, GameState, Constraint
 from .strategies.base import DecisionStrategy
 
+# Most people a game can show: 1000 admitted plus 20000 rejected
+MAX_PEOPLE = 21000
 
-@dataclass
+# Steps between in-place step counter updates when progress output is off
+STEP_COUNTER_EVERY = 100
+
+
+@dataclass(slots=True, eq=False)
 class PersonRecord:
     """Record of a person and the decision made."""
     person_index: int
     attributes: Dict[str, bool]
     decision: bool
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() at decision time, for elapsed-time measurements
     admitted_count_before: int
     rejected_count_before: int
     admitted_count_after: int
@@ -41,12 +48,19 @@ class GameRunner:
         self.game_state: Optional[GameState] = None
         self.initial_game_info: Optional[GameState] = None  # Store initial constraints and stats
         self.people_history: List[PersonRecord] = []
+        # Column arrays of the history, filled alongside people_history
+        self._history_index = np.empty(MAX_PEOPLE, dtype=np.int32)
+        self._history_bits = np.empty(MAX_PEOPLE, dtype=np.uint64)
+        self._history_decision = np.empty(MAX_PEOPLE, dtype=np.bool_)
         self.current_stats = {
             'attribute_counts': {},
-            'admitted_people': [],
-            'rejected_people': [],
             'steps_taken': 0
         }
+        # Constraint attributes and minimum counts, in constraint order
+        self._constraint_attrs: Tuple[str, ...] = ()
+        self._constraint_mins: Tuple[int, ...] = ()
+        # (attribute, bit mask) of each constraint, see Person.attribute_bits
+        self._constraint_masks: List[Tuple[str, int]] = []
         self.game_started = False
         self.game_completed = False
     
@@ -66,9 +80,14 @@ class GameRunner:
         self.initial_game_info = self.api.new_game(scenario)
         self.game_state = self.initial_game_info  # Start with the full initial state
         
+        constraints = self.initial_game_info.constraints
+        self._constraint_attrs = tuple(c.attribute for c in constraints)
+        self._constraint_mins = tuple(c.min_count for c in constraints)
+        
         # Initialize attribute counts based on constraints
-        for constraint in self.initial_game_info.constraints:
+        for i, constraint in enumerate(constraints):
             self.current_stats['attribute_counts'][constraint.attribute] = 0
+            self._constraint_masks.append((constraint.attribute, 1 << i))
         
         # Let strategy know game is starting
         self.strategy.on_game_start(self.initial_game_info)
@@ -97,12 +116,11 @@ class GameRunner:
         print(f"Rejected: {self.game_state.rejected_count}/20000")
         print(f"Steps taken: {self.current_stats['steps_taken']}")
         
-        if self.initial_game_info and self.initial_game_info.constraints:
+        if self._constraint_attrs:
             print(f"\n🎯 CONSTRAINTS:")
-            for constraint in self.initial_game_info.constraints:
-                attr = constraint.attribute
-                required = constraint.min_count
-                current = self.current_stats['attribute_counts'].get(attr, 0)
+            attribute_counts = self.current_stats['attribute_counts']
+            for attr, required in zip(self._constraint_attrs, self._constraint_mins):
+                current = attribute_counts.get(attr, 0)
                 percentage = (current / required * 100) if required > 0 else 100
                 status = "✅" if current >= required else "⚠️"
                 print(f"  {status} {attr}: {current}/{required} ({percentage:.1f}%)")
@@ -171,8 +189,11 @@ class GameRunner:
         
         for step in range(num_steps):
 
-            if not show_progress:
-                print(f"🔄 Step {step+1} of {num_steps}", end="\r")
+            # Throttle on the game-wide step count, as callers often run the game
+            # in chunks shorter than STEP_COUNTER_EVERY, and always show the last step
+            steps_taken = self.current_stats['steps_taken']
+            if not show_progress and (steps_taken % STEP_COUNTER_EVERY == 0 or step == num_steps - 1):
+                print(f"🔄 Step {step+1} of {num_steps} (game step {steps_taken+1})", end="\r", flush=True)
 
             if not self.game_state.next_person or self.game_state.status != 'running':
                 print(f"🏁 Game ended after {step} steps")
@@ -191,9 +212,9 @@ class GameRunner:
             # Create person record
             record = PersonRecord(
                 person_index=person.person_index,
-                attributes=person.attributes.copy(),
+                attributes=person.attributes,  # Never mutated, no need to copy
                 decision=decision,
-                timestamp=time.time(),
+                timestamp=time.monotonic_ns(),
                 admitted_count_before=admitted_before,
                 rejected_count_before=rejected_before,
                 admitted_count_after=admitted_before + (1 if decision else 0),
@@ -201,16 +222,16 @@ class GameRunner:
             )
             
             step_records.append(record)
+            self._record_history_columns(person, decision)
             self.people_history.append(record)
             
             # Update statistics
             if decision:
-                self.current_stats['admitted_people'].append(person.attributes.copy())
-                for attr, value in person.attributes.items():
-                    if value and attr in self.current_stats['attribute_counts']:
-                        self.current_stats['attribute_counts'][attr] += 1
-            else:
-                self.current_stats['rejected_people'].append(person.attributes.copy())
+                attribute_bits = person.attribute_bits
+                attribute_counts = self.current_stats['attribute_counts']
+                for attr, mask in self._constraint_masks:
+                    if attribute_bits & mask:
+                        attribute_counts[attr] += 1
             
             # Show progress
             if show_progress:
@@ -218,7 +239,8 @@ class GameRunner:
                 attrs_str = ", ".join([f"{k}:{v}" for k, v in person.attributes.items()])
                 print(f"Step {self.current_stats['steps_taken']+1}: {action} Person #{person.person_index} [{attrs_str}]")
             
-            # Send decision and get next person
+            # Send decision and get next person. The next person is only known
+            # from the response, so there is nothing to overlap the round-trip with
             self.game_state = self.api.decide_and_next(
                 self.game_state.game_id, 
                 person.person_index, 
@@ -238,6 +260,36 @@ class GameRunner:
         
         return step_records
     
+    def _record_history_columns(self, person: Person, decision: bool):
+        """Write a person into the history column arrays, growing them if needed.
+        
+        Args:
+            person: Person that was decided on
+            decision: Whether the person was admitted
+        """
+        n = len(self.people_history)
+        if n == len(self._history_decision):
+            self._history_index = np.resize(self._history_index, 2 * n)
+            self._history_bits = np.resize(self._history_bits, 2 * n)
+            self._history_decision = np.resize(self._history_decision, 2 * n)
+        self._history_index[n] = person.person_index
+        self._history_bits[n] = person.attribute_bits
+        self._history_decision[n] = decision
+    
+    def get_history_arrays(self) -> Dict[str, np.ndarray]:
+        """Get the people history as column arrays.
+        
+        Returns:
+            Dictionary with 'person_index', 'attribute_bits' (see
+            Person.attribute_bits) and 'decision' arrays, one entry per person seen
+        """
+        n = len(self.people_history)
+        return {
+            'person_index': self._history_index[:n],
+            'attribute_bits': self._history_bits[:n],
+            'decision': self._history_decision[:n]
+        }
+    
     def get_people_seen(self) -> List[PersonRecord]:
         """Get list of all people seen so far.
         
@@ -252,7 +304,9 @@ class GameRunner:
         Returns:
             List of PersonRecord objects for admitted people
         """
-        return [record for record in self.people_history if record.decision]
+        history = self.people_history
+        decisions = self._history_decision[:len(history)]
+        return [history[i] for i in np.flatnonzero(decisions)]
     
     def get_rejected_people(self) -> List[PersonRecord]:
         """Get list of rejected people.
@@ -260,7 +314,9 @@ class GameRunner:
         Returns:
             List of PersonRecord objects for rejected people
         """
-        return [record for record in self.people_history if not record.decision]
+        history = self.people_history
+        decisions = self._history_decision[:len(history)]
+        return [history[i] for i in np.flatnonzero(~decisions)]
     
     def get_game_summary(self) -> Dict[str, Any]:
         """Get comprehensive game summary.
@@ -271,40 +327,45 @@ class GameRunner:
         if not self.game_state:
             return {}
         
-        admitted = self.get_admitted_people()
-        rejected = self.get_rejected_people()
+        total_seen = len(self.people_history)
+        admitted_count = int(np.count_nonzero(self._history_decision[:total_seen]))
+        rejected_count = total_seen - admitted_count
+        attribute_counts = self.current_stats['attribute_counts']
+        
+        constraints = []
+        for attr, required in zip(self._constraint_attrs, self._constraint_mins):
+            actual = attribute_counts.get(attr, 0)
+            constraints.append({
+                'attribute': attr,
+                'required': required,
+                'actual': actual,
+                'satisfied': actual >= required
+            })
         
         return {
             'strategy': self.strategy.get_name(),
             'game_id': self.game_state.game_id,
             'status': self.game_state.status,
             'steps_taken': self.current_stats['steps_taken'],
-            'admitted_count': len(admitted),
-            'rejected_count': len(rejected),
-            'total_seen': len(self.people_history),
-            'success': self.game_state.status == 'completed' and len(admitted) == 1000,
-            'constraints': [
-                {
-                    'attribute': c.attribute,
-                    'required': c.min_count,
-                    'actual': self.current_stats['attribute_counts'].get(c.attribute, 0),
-                    'satisfied': self.current_stats['attribute_counts'].get(c.attribute, 0) >= c.min_count
-                }
-                for c in (self.initial_game_info.constraints if self.initial_game_info else [])
-            ],
+            'admitted_count': admitted_count,
+            'rejected_count': rejected_count,
+            'total_seen': total_seen,
+            'success': self.game_state.status == 'completed' and admitted_count == 1000,
+            'constraints': constraints,
             'current_stats': self.current_stats,
             'people_history': self.people_history
         }
     
-    def save_game_state(self, filename: str = None) -> str:
+    def save_game_state(self, filename: str = None, pretty: bool = False) -> str:
         """Save current game state to file.
         
         Args:
             filename: Optional filename
+            pretty: Whether to indent the JSON output
             
         Returns:
             Path to saved file
         """
         from ..utils import save_results
         summary = self.get_game_summary()
-        return save_results(summary, filename)
+        return save_results(summary, filename, pretty=pretty)
@@ -1,7 +1,7 @@
 """Base strategy class for the Berghain puzzle."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, List, Any
 
 # Import from parent package
 from ..api import Person, GameState
@@ -14,16 +14,44 @@ class DecisionStrategy(ABC):
     def decide(self, person: Person, game_state: GameState, current_stats: Dict[str, Any]) -> bool:
         """Decide whether to accept or reject a person.
         
+        The person's attributes dict is shared with the game history records
+        and must be treated as read-only.
+        
+        current_stats only holds running counters, never the list of admitted
+        people: 'attribute_counts' (admitted people per constraint attribute)
+        and 'steps_taken'. The admitted count is game_state.admitted_count, and
+        any other counter a strategy needs (such as admitted people without
+        attributes) should be kept up to date in on_decision_made().
+        
         Args:
             person: The person to evaluate
             game_state: Current game state
-            current_stats: Current statistics about admitted people
+            current_stats: Running counters about admitted people
             
         Returns:
             True to accept, False to reject
         """
         pass
     
+    def decide_batch(self, persons: List[Person], game_state: GameState,
+                     current_stats: Dict[str, Any]) -> List[bool]:
+        """Decide on several people against the same game state.
+        
+        Nothing is updated between the people, so this suits offline evaluation
+        of a known list of arrivals rather than the live game, where every
+        decision changes the state. Override to vectorize; the default decides
+        one person at a time.
+        
+        Args:
+            persons: The people to evaluate
+            game_state: Current game state
+            current_stats: Running counters about admitted people
+            
+        Returns:
+            One decision per person, True to accept
+        """
+        return [self.decide(person, game_state, current_stats) for person in persons]
+    
     @abstractmethod
     def get_name(self) -> str:
         """Get the name of this strategy."""
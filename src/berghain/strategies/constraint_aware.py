@@ -17,35 +17,55 @@ class ConstraintAwareStrategy(DecisionStrategy):
             safety_margin: Extra margin above minimum requirements (0.1 = 10% extra)
         """
         self.safety_margin = safety_margin
+        # Per-constraint state, indexed like the constraints (and attribute bits)
+        self._targets = []
+        self._still_needed = []
+        self._masks = []
     
-    def decide(self, person: Person, game_state: GameState, current_stats: Dict[str, Any]) -> bool:
+    def on_game_start(self, game_state: GameState) -> None:
+        """Precompute the target count of each constraint, safety margin included."""
+        self._targets = [
+            int(constraint.min_count * (1 + self.safety_margin))
+            for constraint in game_state.constraints
+        ]
+        self._still_needed = list(self._targets)
+        # Bit of each constraint attribute in Person.attribute_bits
+        self._masks = [1 << i for i in range(len(self._targets))]
+    
+    def on_decision_made(self, person: Person, decision: bool, game_state: GameState) -> None:
+        """Update how many more people each constraint still needs."""
+        if decision:
+            attribute_bits = person.attribute_bits
+            still_needed = self._still_needed
+            for i, mask in enumerate(self._masks):
+                if attribute_bits & mask:
+                    still_needed[i] -= 1
+    
+    def decide(self, person: Person, game_state: GameState, current_stats: Dict[str, Any],
+               show_progress: bool = True) -> bool:
         """Make decision based on constraints and current progress."""
         # Always accept if we have space and no constraints to worry about
         if game_state.admitted_count >= 1000:
             return False
             
-        if not game_state.constraints:
+        if not self._still_needed:
             return True
         
         # Calculate how much we need of each attribute
         remaining_spots = 1000 - game_state.admitted_count
+        urgent_threshold = remaining_spots * 0.8
         
-        for constraint in game_state.constraints:
-            attr = constraint.attribute
-            min_needed = constraint.min_count
-            
-            # Add safety margin
-            target_count = int(min_needed * (1 + self.safety_margin))
-            
-            current_count = current_stats.get('attribute_counts', {}).get(attr, 0)
-            still_needed = target_count - current_count
+        attribute_bits = person.attribute_bits
+        
+        for mask, still_needed in zip(self._masks, self._still_needed):
+            has_attr = attribute_bits & mask
             
             # If this person has the attribute we need and we still need it
-            if person.attributes.get(attr, False) and still_needed > 0:
+            if has_attr and still_needed > 0:
                 return True
                 
             # If we desperately need this attribute and this person doesn't have it
-            if still_needed > remaining_spots * 0.8 and not person.attributes.get(attr, False):
+            if still_needed > urgent_threshold and not has_attr:
                 return False
         
         # Default to accepting if no urgent constraints
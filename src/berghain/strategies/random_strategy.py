@@ -1,7 +1,7 @@
 """Random decision strategy for the Berghain puzzle."""
 
 import random
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base import DecisionStrategy
 
 # Import from parent package
@@ -11,17 +11,21 @@ from ..api import Person, GameState
 class RandomStrategy(DecisionStrategy):
     """Random decision strategy for testing."""
     
-    def __init__(self, acceptance_rate: float = 0.5):
+    def __init__(self, acceptance_rate: float = 0.5, seed: Optional[int] = None):
         """Initialize with acceptance rate.
         
         Args:
             acceptance_rate: Probability of accepting any person
+            seed: Optional seed of the strategy's own random generator, for reproducible runs
         """
         self.acceptance_rate = acceptance_rate
+        # Own generator, with its bound method cached for the per-person draw
+        self._rng = random.Random(seed).random
     
-    def decide(self, person: Person, game_state: GameState, current_stats: Dict[str, Any]) -> bool:
+    def decide(self, person: Person, game_state: GameState, current_stats: Dict[str, Any],
+               show_progress: bool = True) -> bool:
         """Make a random decision."""
-        return random.random() < self.acceptance_rate
+        return self._rng() < self.acceptance_rate
     
     def get_name(self) -> str:
         return f"Random({self.acceptance_rate})"
@@ -1,60 +1,146 @@
 """Constraint-aware strategy for the Berghain puzzle."""
 
-from typing import Dict, Any
-import random
+from typing import Dict, List, Any, Optional
+import numpy as np
 from .base import DecisionStrategy
 
 # Import from parent package
 from ..api import Person, GameState
 
+# Venue fill levels at which verbose decisions report progress and tolerance
+MILESTONE_POINTS = (0.1, 0.2, 0.3, 0.5, 0.7, 0.8, 0.9)
+
+# Admitted counts within half a percent of a milestone point
+MILESTONE_COUNTS = frozenset(
+    n for n in range(1001) if any(abs(n / 1000.0 - mp) < 0.005 for mp in MILESTONE_POINTS)
+)
+
+# Admitted counts between verbose no-attribute decision reports
+NO_ATTR_REPORT_EVERY = 50
+
+# Number of uniform random draws generated at once for no-attribute decisions
+RANDOM_BATCH_SIZE = 4096
+
 
 class Scenario1Strategy(DecisionStrategy):
     """Enhanced strategy that uses statistical information and strict no-attribute controls."""
     
-    def __init__(self, initial_tolerance: float = 0.20, final_tolerance: float = 0.02, strictness_start: float = 0.1):
+    def __init__(self, initial_tolerance: float = 0.20, final_tolerance: float = 0.02, strictness_start: float = 0.1,
+                 seed: Optional[int] = None):
         """Initialize with dynamic tolerance that decreases over time.
         
         Args:
             initial_tolerance: Starting tolerance when venue is empty (0.20 = 20% tolerance)
             final_tolerance: Final tolerance when venue is nearly full (0.02 = 2% tolerance)
             strictness_start: When to start reducing tolerance (0.1 = after 10% of venue filled)
+            seed: Optional seed of the strategy's own random generator, for reproducible runs
         """
         self.initial_tolerance = initial_tolerance
         self.final_tolerance = final_tolerance
         self.strictness_start = strictness_start
+        self._tolerance_schedule = self._build_tolerance_schedule()
+        self._base_rate_schedule = tuple(self._no_attr_base_rate(n / 1000.0) for n in range(1001))
         self._constraints = []
+        # Per-constraint values, as parallel tuples indexed like the constraints
+        self._constraint_attrs = ()
+        self._required_counts = ()
+        self._target_percentages = ()
+        self._under_thresholds = ()
+        self._constraint_freqs = ()
+        self._positive_correlations = ()
         self._relative_frequencies = {}
         self._correlations = {}
         self._attribute_statistics = None
+        self._no_attr_admitted = 0
+        # Inputs of the no-attributes target are fixed for a game, compute it once
+        self._no_attr_target_cached: Optional[float] = None
+        # Uniform draws are generated in batches and consumed one at a time
+        self._rng = np.random.default_rng(seed)
+        self._uniform_batch = []
     
-    def _calculate_current_tolerance(self, admitted_count: int) -> float:
-        """Calculate current tolerance based on how full the venue is.
+    def _build_tolerance_schedule(self) -> tuple:
+        """Precompute the tolerance for every possible admitted count (0 to 1000).
         
-        Args:
-            admitted_count: Number of people currently admitted
-            
         Returns:
-            Current tolerance value
+            Tuple of tolerance values indexed by admitted count
         """
         # Calculate progress through the venue (0.0 to 1.0)
-        progress = admitted_count / 1000.0
-
-        if progress >= 0.95:
-            return 0
+        progress = np.arange(1001) / 1000.0
         
-        # Before strictness_start, use initial tolerance
-        if progress <= self.strictness_start:
-            return self.initial_tolerance
+        # Initial tolerance until strictness_start, then linearly interpolate
+        # to the final tolerance (np.interp clamps outside the strictness phase)
+        schedule = np.interp(progress, [self.strictness_start, 1.0],
+                             [self.initial_tolerance, self.final_tolerance])
         
-        # After strictness_start, linearly interpolate to final tolerance
-        # Calculate how far we are in the strictness phase
-        strictness_progress = (progress - self.strictness_start) / (1.0 - self.strictness_start)
-        strictness_progress = min(1.0, max(0.0, strictness_progress))  # Clamp to [0,1]
+        # No tolerance at all once the venue is nearly full
+        schedule[progress >= 0.95] = 0.0
         
-        # Linear interpolation between initial and final tolerance
-        current_tolerance = self.initial_tolerance - (self.initial_tolerance - self.final_tolerance) * strictness_progress
+        return tuple(schedule.tolist())
+    
+    @staticmethod
+    def _no_attr_base_rate(progress: float) -> float:
+        """Base acceptance rate of people with no attributes at a given venue fill.
         
-        return current_tolerance
+        Args:
+            progress: Progress through the venue (0.0 to 1.0)
+            
+        Returns:
+            Base acceptance rate
+        """
+        if progress <= 0.05:
+            # Very early game: still be selective (20%)
+            return 0.2
+        elif progress <= 0.15:
+            # Early game: low acceptance rate (15%)
+            return 0.15
+        elif progress <= 0.3:
+            # Early-mid game: lower rate (10%)
+            return 0.1
+        elif progress <= 0.5:
+            # Mid game: very low rate (5%)
+            return 0.05
+        elif progress <= 0.7:
+            # Late-mid game: extremely low rate (2%)
+            return 0.02
+        elif progress <= 0.9:
+            # Late game: barely accept (1%)
+            return 0.01
+        else:
+            # Final stage: almost never accept
+            return 0.005
+    
+    def _uniform(self) -> float:
+        """Draw a uniform random number in [0, 1) from the pregenerated batch.
+        
+        Returns:
+            Uniform random number
+        """
+        if not self._uniform_batch:
+            # Python floats, so the comparisons do not go through NumPy scalars
+            self._uniform_batch = self._rng.random(RANDOM_BATCH_SIZE).tolist()
+        return self._uniform_batch.pop()
+    
+    def _set_constraints(self, constraints) -> None:
+        """Store the game constraints and precompute their per-constraint values.
+        
+        Args:
+            constraints: Constraints of the game
+        """
+        self._constraints = constraints
+        self._constraint_attrs = tuple(c.attribute for c in constraints)
+        self._required_counts = tuple(c.min_count for c in constraints)
+        self._target_percentages = tuple(count / 1000.0 for count in self._required_counts)
+        # Percentage below which a constraint counts as under-represented
+        self._under_thresholds = tuple(target - 0.08 for target in self._target_percentages)
+        # Relative frequency of each constraint attribute, None when unknown
+        self._constraint_freqs = tuple(self._relative_frequencies.get(attr) for attr in self._constraint_attrs)
+        # (other attribute, correlation) pairs positively correlated (> 0.1) with each constraint
+        self._positive_correlations = tuple(
+            tuple((other_attr, corr) for other_attr, corr in self._correlations.get(attr, {}).items()
+                  if other_attr != attr and corr > 0.1)
+            for attr in self._constraint_attrs
+        )
+        self._no_attr_target_cached = None
     
     def _calculate_no_attributes_target_with_statistics(self) -> float:
         """Calculate target percentage for people with no attributes using statistical data.
@@ -72,7 +158,7 @@ class Scenario1Strategy(DecisionStrategy):
         # Calculate probability that a random person has NONE of the constraint attributes
         # This uses the inclusion-exclusion principle with correlations
         
-        constraint_attrs = [c.attribute for c in self._constraints]
+        constraint_attrs = self._constraint_attrs
         
         if len(constraint_attrs) == 1:
             # Simple case: P(not A) = 1 - P(A)
@@ -138,51 +224,29 @@ class Scenario1Strategy(DecisionStrategy):
         Returns:
             True to accept, False to reject
         """
-        # Calculate progress through the venue
-        progress = admitted_count / 1000.0
-        
-        # Count current people with no attributes
-        admitted_people = current_stats.get('admitted_people', [])
-        current_no_attr_count = sum(1 for person in admitted_people 
-                                   if all(not person.get(attr, False) for attr in person))
-        
-        # Calculate current percentage among admitted people
-        current_no_attr_percentage = (current_no_attr_count / len(admitted_people)) if admitted_people else 0
+        # Calculate current percentage of people with no attributes among admitted people
+        current_no_attr_percentage = (self._no_attr_admitted / admitted_count) if admitted_count else 0
         
         # Use statistical target calculation
-        target_percentage = self._calculate_no_attributes_target_with_statistics()
+        target_percentage = self._no_attr_target_cached
+        if target_percentage is None:
+            target_percentage = self._no_attr_target_cached = self._calculate_no_attributes_target_with_statistics()
         
-        if show_progress and admitted_count % 50 == 0:  # Print target occasionally
+        # Report no-attribute decisions occasionally rather than for every person
+        report = show_progress and admitted_count % NO_ATTR_REPORT_EVERY == 0
+        
+        if report:
             print(f"  📊 No-attr target: {target_percentage:.1%} (based on frequencies)")
         
         # If we're already over-represented, be extremely selective
         if current_no_attr_percentage > (target_percentage + 0.02):  # Very tight tolerance
-            if show_progress:
+            if report:
                 print(f"  🚫 No-attr over-represented ({current_no_attr_percentage:.1%} vs target {target_percentage:.1%})")
             return False
         
-        # MUCH more restrictive base rates
-        if progress <= 0.05:
-            # Very early game: still be selective (20%)
-            base_rate = 0.2
-        elif progress <= 0.15:
-            # Early game: low acceptance rate (15%)
-            base_rate = 0.15
-        elif progress <= 0.3:
-            # Early-mid game: lower rate (10%)
-            base_rate = 0.1
-        elif progress <= 0.5:
-            # Mid game: very low rate (5%)
-            base_rate = 0.05
-        elif progress <= 0.7:
-            # Late-mid game: extremely low rate (2%)
-            base_rate = 0.02
-        elif progress <= 0.9:
-            # Late game: barely accept (1%)
-            base_rate = 0.01
-        else:
-            # Final stage: almost never accept
-            base_rate = 0.005
+        # MUCH more restrictive base rates, looked up by admitted count
+        # (decide only gets here with fewer than 1000 people admitted)
+        base_rate = self._base_rate_schedule[admitted_count]
         
         # Adjust rate based on how close we are to target
         if current_no_attr_percentage < (target_percentage - 0.1):
@@ -200,14 +264,11 @@ class Scenario1Strategy(DecisionStrategy):
         
         # Additional constraint: if we have constraint attributes that are under-represented,
         # be even more selective about no-attribute people
-        if self._constraints and admitted_people:
+        if self._constraints and admitted_count:
             any_constraint_struggling = False
-            for constraint in self._constraints:
-                attr = constraint.attribute
-                current_count = current_stats.get('attribute_counts', {}).get(attr, 0)
-                required_count = constraint.min_count
-                current_attr_percentage = current_count / len(admitted_people)
-                target_attr_percentage = required_count / 1000.0
+            attribute_counts = current_stats.get('attribute_counts', {})
+            for attr, target_attr_percentage in zip(self._constraint_attrs, self._target_percentages):
+                current_attr_percentage = attribute_counts.get(attr, 0) / admitted_count
                 
                 # If any constraint is significantly behind target
                 if current_attr_percentage < (target_attr_percentage - 0.05):
@@ -216,36 +277,18 @@ class Scenario1Strategy(DecisionStrategy):
             
             if any_constraint_struggling:
                 acceptance_rate *= 0.5  # Be even more selective
-                if show_progress:
+                if report:
                     print(f"  ⚠️  Constraint attributes struggling, reducing no-attr acceptance")
         
         # Use random decision based on acceptance rate
-        decision = random.random() < acceptance_rate
+        decision = self._uniform() < acceptance_rate
         
-        if show_progress:
-            if decision:
-                print(f"  ✅ Accepting no-attr person ({current_no_attr_percentage:.1%} current vs {target_percentage:.1%} target, rate {acceptance_rate:.1%})")
-            else:
-                print(f"  🚫 Rejecting no-attr person ({current_no_attr_percentage:.1%} current vs {target_percentage:.1%} target, rate {acceptance_rate:.1%})")
+        if report:
+            action = "✅ Accepting" if decision else "🚫 Rejecting"
+            print(f"  {action} no-attr person ({current_no_attr_percentage:.1%} current vs {target_percentage:.1%} target, rate {acceptance_rate:.1%})")
             
         return decision
     
-    def _calculate_expected_attribute_yield(self, attr: str, remaining_people: int) -> float:
-        """Calculate expected number of people with attribute based on relative frequency.
-        
-        Args:
-            attr: Attribute name
-            remaining_people: Number of people still to be seen
-            
-        Returns:
-            Expected count of people with this attribute
-        """
-        if not self._relative_frequencies:
-            return remaining_people * 0.5  # Default 50% assumption
-        
-        frequency = self._relative_frequencies.get(attr, 0.5)
-        return remaining_people * frequency
-    
     def decide(self, person: Person, game_state: GameState, current_stats: Dict[str, Any], show_progress: bool = True) -> bool:
         """Enhanced decision making using statistical information and strict no-attribute control."""
         
@@ -254,49 +297,56 @@ class Scenario1Strategy(DecisionStrategy):
             return False
         
         # Handle people with no attributes using enhanced statistical approach
-        if all(not person.attributes.get(attr, False) for attr in person.attributes):
+        if not person.attribute_bits:
             return self._decide_no_attributes_person(game_state.admitted_count, current_stats, show_progress)
         
         # If we haven't admitted anyone yet, accept to get started
-        admitted_count = current_stats.get('admitted_people', [])
-        if len(admitted_count) == 0:
+        total_admitted = game_state.admitted_count
+        if total_admitted == 0:
             return True
         
-        # Get constraints
-        if not hasattr(self, '_constraints') or not self._constraints:
-            constraints = getattr(game_state, 'constraints', [])
-            if constraints:
-                self._constraints = constraints
-            else:
+        # Get constraints (set up once, on_game_start normally has done it)
+        if not self._constraints:
+            constraints = game_state.constraints
+            if not constraints:
                 return True
-        else:
-            constraints = self._constraints
+            self._set_constraints(constraints)
         
         # Calculate current percentages among admitted people
-        total_admitted = len(admitted_count)
         remaining_spots = 1000 - total_admitted
         
-        # Calculate dynamic tolerance based on venue fullness
-        current_tolerance = self._calculate_current_tolerance(total_admitted)
+        # Calculate dynamic tolerance based on venue fullness (0 < total_admitted < 1000
+        # here, so index the schedule directly instead of clamping)
+        current_tolerance = self._tolerance_schedule[total_admitted]
         
         # Show statistical information occasionally
-        progress = total_admitted / 1000.0
-        milestone_points = [0.1, 0.2, 0.3, 0.5, 0.7, 0.8, 0.9]
-        if any(abs(progress - mp) < 0.005 for mp in milestone_points) and show_progress:
-            print(f"  📊 Progress: {progress:.1%}, Tolerance: {current_tolerance:.1%}")
+        if show_progress and total_admitted in MILESTONE_COUNTS:
+            print(f"  📊 Progress: {total_admitted / 1000.0:.1%}, Tolerance: {current_tolerance:.1%}")
             if self._relative_frequencies:
                 print(f"  📈 Frequencies: {self._relative_frequencies}")
         
-        for constraint in constraints:
-            attr = constraint.attribute
-            required_count = constraint.min_count
-            target_percentage = required_count / 1000.0
+        # Loop invariants, looked up once per decision
+        attribute_counts = current_stats.get('attribute_counts', {})
+        person_attributes = person.attributes
+        # Bit i of attribute_bits is the attribute of the i-th constraint
+        attribute_bits = person.attribute_bits
+        
+        attr_names = self._constraint_attrs
+        required_counts = self._required_counts
+        target_percentages = self._target_percentages
+        under_thresholds = self._under_thresholds
+        constraint_freqs = self._constraint_freqs
+        
+        for i in range(len(attr_names)):
+            attr = attr_names[i]
+            required_count = required_counts[i]
+            target_percentage = target_percentages[i]
             
-            # Current count and percentage
-            current_count = current_stats.get('attribute_counts', {}).get(attr, 0)
-            current_percentage = current_count / total_admitted if total_admitted > 0 else 0
+            # Current count and percentage (total_admitted is positive here)
+            current_count = attribute_counts.get(attr, 0)
+            current_percentage = current_count / total_admitted
             
-            person_has_attr = person.attributes.get(attr, False)
+            person_has_attr = (attribute_bits >> i) & 1
             
             # Enhanced over-representation check using statistical expectations
             if person_has_attr and current_percentage > (target_percentage + current_tolerance):
@@ -305,12 +355,13 @@ class Scenario1Strategy(DecisionStrategy):
                 return False
             
             # Enhanced under-representation check using expected yield
-            if not person_has_attr and current_percentage < (target_percentage - 0.08):
+            if not person_has_attr and current_percentage < under_thresholds[i]:
                 still_needed = required_count - current_count
                 
                 # Use statistical information to estimate if we can still meet the constraint
-                if self._relative_frequencies and attr in self._relative_frequencies:
-                    expected_yield = self._calculate_expected_attribute_yield(attr, remaining_spots)
+                frequency = constraint_freqs[i]
+                if frequency is not None:
+                    expected_yield = remaining_spots * frequency
                     
                     # If expected yield from remaining people is insufficient, be selective
                     if expected_yield < still_needed * 1.2:  # Need 20% buffer
@@ -325,27 +376,62 @@ class Scenario1Strategy(DecisionStrategy):
                             print(f"  🚫 Rejecting: Need more {attr} ({current_count}/{required_count})")
                         return False
             
-            # Bonus: if person has a highly correlated attribute combination, prefer them
-            if person_has_attr and self._correlations:
-                person_attrs = [a for a, v in person.attributes.items() if v]
-                if len(person_attrs) > 1:
-                    # Check if this person has positively correlated attributes
-                    correlation_bonus = 0
-                    for other_attr in person_attrs:
-                        if other_attr != attr and other_attr in self._correlations.get(attr, {}):
-                            corr = self._correlations[attr][other_attr]
-                            if corr > 0.1:  # Positive correlation
-                                correlation_bonus += corr
-                    
-                    if correlation_bonus > 0.2 and show_progress:
-                        print(f"  ⭐ Person has correlated attributes ({attr} + others), correlation bonus: {correlation_bonus:.2f}")
+            # Bonus: if person has a highly correlated attribute combination, report it
+            # (only affects the progress output, so skip the work when it is hidden)
+            if show_progress and person_has_attr and self._positive_correlations[i]:
+                # Sum the positive correlations with the other attributes the person has
+                correlation_bonus = 0
+                for other_attr, corr in self._positive_correlations[i]:
+                    if person_attributes.get(other_attr):
+                        correlation_bonus += corr
+                
+                if correlation_bonus > 0.2:
+                    print(f"  ⭐ Person has correlated attributes ({attr} + others), correlation bonus: {correlation_bonus:.2f}")
         
         # Accept if no over-representation concerns
         return True
     
+    def decide_batch(self, persons: List[Person], game_state: GameState, current_stats: Dict[str, Any],
+                     show_progress: bool = False) -> List[bool]:
+        """Decide on several people against the same game state.
+        
+        People with an over-represented constraint attribute are rejected in one
+        vectorized test on their attribute bits; everyone else goes through decide().
+        
+        Args:
+            persons: The people to evaluate
+            game_state: Current game state
+            current_stats: Running counters about admitted people
+            show_progress: Whether to print the decisions made through decide()
+            
+        Returns:
+            One decision per person, True to accept
+        """
+        total_admitted = game_state.admitted_count
+        if not persons or not self._constraints or not 0 < total_admitted < 1000:
+            return [self.decide(person, game_state, current_stats, show_progress) for person in persons]
+        
+        # Bit mask of the constraints currently above target plus tolerance
+        attribute_counts = current_stats.get('attribute_counts', {})
+        current_tolerance = self._tolerance_schedule[total_admitted]
+        over_mask = 0
+        for i, (attr, target_percentage) in enumerate(zip(self._constraint_attrs, self._target_percentages)):
+            if attribute_counts.get(attr, 0) / total_admitted > target_percentage + current_tolerance:
+                over_mask |= 1 << i
+        
+        if not over_mask:
+            return [self.decide(person, game_state, current_stats, show_progress) for person in persons]
+        
+        bits = np.fromiter((person.attribute_bits for person in persons), dtype=np.uint64, count=len(persons))
+        over_represented = ((bits & np.uint64(over_mask)) != 0).tolist()
+        return [
+            False if rejected else self.decide(person, game_state, current_stats, show_progress)
+            for person, rejected in zip(persons, over_represented)
+        ]
+    
     def on_game_start(self, game_state: GameState) -> None:
         """Store constraints and statistical information when game starts."""
-        self._constraints = getattr(game_state, 'constraints', [])
+        self._no_attr_admitted = 0
         
         # Extract statistical information from attribute_statistics
         attribute_statistics = getattr(game_state, 'attribute_statistics', None)
@@ -353,19 +439,28 @@ class Scenario1Strategy(DecisionStrategy):
             self._relative_frequencies = getattr(attribute_statistics, 'relative_frequencies', {})
             self._correlations = getattr(attribute_statistics, 'correlations', {})
             self._attribute_statistics = attribute_statistics
-            
+        
+        # After the frequencies, which the per-constraint values include
+        self._set_constraints(getattr(game_state, 'constraints', []))
+        
+        if attribute_statistics:
             print(f"  📊 Loaded statistical data:")
             print(f"      Relative frequencies: {self._relative_frequencies}")
             print(f"      Correlations available for: {list(self._correlations.keys())}")
             
             # Calculate and display the statistical no-attributes target
             if self._constraints:
-                stat_target = self._calculate_no_attributes_target_with_statistics()
+                stat_target = self._no_attr_target_cached = self._calculate_no_attributes_target_with_statistics()
                 basic_target = self._calculate_no_attributes_target_basic()
                 print(f"      No-attr target: {stat_target:.1%} (statistical) vs {basic_target:.1%} (basic)")
         else:
             print(f"  ⚠️  No statistical data available, using fallback logic")
     
+    def on_decision_made(self, person: Person, decision: bool, game_state: GameState) -> None:
+        """Count admitted people with no attributes."""
+        if decision and not person.attribute_bits:
+            self._no_attr_admitted += 1
+    
     def get_name(self) -> str:
         stat_info = "with_stats" if self._relative_frequencies else "no_stats"
         return f"Scenario1Strategy_Enhanced(tol:{self.initial_tolerance:.0%}->{self.final_tolerance:.0%}@{self.strictness_start:.0%},{stat_info})"
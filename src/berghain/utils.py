@@ -1,42 +1,110 @@
 """Utility functions for the Berghain puzzle."""
 
 from typing import Dict, List, Any
+import dataclasses
 import json
 import os
-from datetime import datetime
+import time
 
+import numpy as np
 
-def save_results(results: Dict[str, Any], filename: str = None) -> str:
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
+
+RESULTS_DIR = "results"
+
+
+def _open_results_file(filepath: str, mode: str):
+    """Open a results file for writing, creating its directory when missing.
+    
+    The directory is only created when opening fails, so the common case costs
+    no extra system call, and a directory removed (or a cwd changed) since the
+    last save is still handled.
+    
+    Args:
+        filepath: Path of the file to write
+        mode: Mode passed to open()
+        
+    Returns:
+        Open file object
+    """
+    try:
+        return open(filepath, mode)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        return open(filepath, mode)
+
+
+def save_results(results: Dict[str, Any], filename: str = None, pretty: bool = False) -> str:
     """Save game results to a JSON file.
     
+    Output is compact unless pretty is set.
+    
     Args:
         results: Results dictionary from GameRunner
         filename: Optional filename, if not provided will use timestamp
+        pretty: Whether to indent the output for human readers
         
     Returns:
         Path to saved file
     """
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         strategy_name = results.get('strategy', 'unknown').replace(' ', '_')
         scenario = results.get('scenario', 'unknown')
         filename = f"results_{strategy_name}_scenario{scenario}_{timestamp}.json"
     
-    # Create results directory if it doesn't exist
-    results_dir = "results"
-    os.makedirs(results_dir, exist_ok=True)
+    filepath = os.path.join(RESULTS_DIR, filename)
     
-    filepath = os.path.join(results_dir, filename)
+    if orjson is not None:
+        # orjson serializes dataclasses (the people history) natively and
+        # converts anything else it does not know to a string
+        option = (orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY |
+                  orjson.OPT_NON_STR_KEYS)
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with _open_results_file(filepath, 'wb') as f:
+            f.write(orjson.dumps(results, option=option, default=str))
+        return filepath
     
     # Convert any non-serializable objects to strings
     serializable_results = make_serializable(results)
     
-    with open(filepath, 'w') as f:
-        json.dump(serializable_results, f, indent=2)
+    with _open_results_file(filepath, 'w') as f:
+        if pretty:
+            json.dump(serializable_results, f, indent=2)
+        else:
+            json.dump(serializable_results, f, separators=(',', ':'))
     
     return filepath
 
 
+def write_json(obj: Any, filepath: str, pretty: bool = False) -> None:
+    """Write a JSON-serializable object to a file.
+    
+    Output is compact unless pretty is set. Uses orjson when it is installed.
+    
+    Args:
+        obj: Object to write
+        filepath: Path to the output file
+        pretty: Whether to indent the output for human readers
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(filepath, 'w') as f:
+            if pretty:
+                json.dump(obj, f, indent=2)
+            else:
+                json.dump(obj, f, separators=(',', ':'))
+
+
 def load_results(filepath: str) -> Dict[str, Any]:
     """Load game results from a JSON file.
     
@@ -50,38 +118,151 @@ def load_results(filepath: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+# Same types for isinstance, which also accepts subclasses (e.g. np.float64)
+_PRIMITIVE_BASES = tuple(_PRIMITIVE_TYPES)
+
+# Exact container types mapped to a function yielding their (key, value) pairs
+_CONTAINER_ITEMS = {dict: dict.items, list: enumerate, tuple: enumerate}
+
+
+def _container_items(obj: Any):
+    """Return an empty output container and the (key, value) pairs to fill it with.
+    
+    Args:
+        obj: Object to convert
+        
+    Returns:
+        Tuple of (output container, iterable of pairs), or None for leaf objects
+    """
+    items = _CONTAINER_ITEMS.get(type(obj))
+    if items is not None:
+        return ({} if type(obj) is dict else [None] * len(obj)), items(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Slotted dataclasses have no __dict__
+        return {}, ((f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj))
+    if hasattr(obj, '__dict__'):
+        return {}, vars(obj).items()
+    if isinstance(obj, dict):
+        return {}, obj.items()
+    if isinstance(obj, (list, tuple)):
+        return [None] * len(obj), enumerate(obj)
+    return None
+
+
 def make_serializable(obj: Any) -> Any:
     """Convert objects to JSON-serializable format.
     
+    Walks the object with an explicit stack instead of recursing, and converts
+    objects shared between several places only once.
+    
     Args:
         obj: Object to convert
         
     Returns:
         Serializable version of the object
     """
-    if hasattr(obj, '__dict__'):
-        # Convert dataclass or custom objects to dict
-        return {k: make_serializable(v) for k, v in obj.__dict__.items()}
-    elif isinstance(obj, dict):
-        return {k: make_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [make_serializable(item) for item in obj]
-    elif isinstance(obj, (str, int, float, bool, type(None))):
+    if type(obj) in _PRIMITIVE_TYPES:
         return obj
-    else:
-        # Convert other types to string
-        return str(obj)
+    
+    root = [None]
+    converted = {}
+    stack = [(obj, root, 0)]
+    while stack:
+        item, parent, key = stack.pop()
+        if type(item) in _PRIMITIVE_TYPES:
+            parent[key] = item
+            continue
+        
+        done = converted.get(id(item))
+        if done is not None:
+            parent[key] = done
+            continue
+        
+        if isinstance(item, _PRIMITIVE_BASES):
+            # Subclasses of the primitive types (np.float64, IntEnum, ...) are
+            # serializable as is
+            parent[key] = item
+            continue
+        
+        container = _container_items(item)
+        if container is None:
+            # Convert other types to string
+            parent[key] = str(item)
+            continue
+        
+        out, pairs = container
+        converted[id(item)] = out
+        parent[key] = out
+        if type(out) is dict:
+            pairs = list(pairs)
+            # Reserve the keys in order so that the output keeps the input order
+            for child_key, _ in pairs:
+                out[child_key] = None
+        stack.extend((value, out, child_key) for child_key, value in pairs)
+    
+    return root[0]
+
+
+# Number of results whose metrics are kept by calculate_strategy_metrics()
+METRICS_CACHE_SIZE = 1024
+
+# Metrics already computed, keyed on the identifying fields of a result and
+# ordered from least to most recently used
+_metrics_cache: Dict[tuple, Dict[str, float]] = {}
+
+
+def _metrics_cache_key(results: Dict[str, Any]) -> tuple:
+    """Build the metrics cache key of a result.
+    
+    Uses content rather than id() so that a result reloaded from disk (or in
+    another worker) maps to the same entry. Covers every field the metrics are
+    computed from, including each constraint and its attribute count.
+    
+    Args:
+        results: Results from GameRunner.run_game()
+        
+    Returns:
+        Hashable key identifying the result
+    """
+    constraints = results.get('constraints', [])
+    constraint_counts = ()
+    if constraints:
+        attribute_counts = results['current_stats']['attribute_counts']
+        constraint_counts = tuple(
+            (c.attribute, c.min_count, attribute_counts.get(c.attribute, 0))
+            for c in constraints
+        )
+    return (results.get('game_id'), results['strategy'], results.get('status'),
+            bool(results['success']), results['admitted_count'],
+            results['rejected_count'], constraint_counts)
+
+
+def clear_metrics_cache() -> None:
+    """Forget all metrics memoized by calculate_strategy_metrics()."""
+    _metrics_cache.clear()
 
 
 def calculate_strategy_metrics(results: Dict[str, Any]) -> Dict[str, float]:
     """Calculate performance metrics for a strategy.
     
+    The metrics of the last METRICS_CACHE_SIZE results are memoized, so
+    scoring the same result again in a sweep is free.
+    
     Args:
         results: Results from GameRunner.run_game()
         
     Returns:
         Dictionary of performance metrics
     """
+    key = _metrics_cache_key(results)
+    cached = _metrics_cache.pop(key, None)
+    if cached is not None:
+        # Reinsert to mark the entry as most recently used
+        _metrics_cache[key] = cached
+        # Callers add their own fields, so hand out a copy
+        return dict(cached)
+    
     metrics = {}
     
     # Basic metrics
@@ -118,7 +299,11 @@ def calculate_strategy_metrics(results: Dict[str, Any]) -> Dict[str, float]:
         metrics['constraints_met'] = sum(1 for score in constraint_scores if score >= 1.0)
         metrics['total_constraints'] = len(constraints)
     
-    return metrics
+    if len(_metrics_cache) >= METRICS_CACHE_SIZE:
+        # Evict the least recently used entry
+        del _metrics_cache[next(iter(_metrics_cache))]
+    _metrics_cache[key] = metrics
+    return dict(metrics)
 
 
 def compare_strategies(results_list: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -149,28 +334,31 @@ def compare_strategies(results_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         all_metrics.append(metrics)
         comparison['strategies'].append(strategy_name)
     
-    # Aggregate metrics
+    # Stack the metrics into a (strategies x metrics) array and reduce per column
     metric_names = [k for k in all_metrics[0].keys() if k != 'strategy']
-    for metric in metric_names:
-        values = [m[metric] for m in all_metrics]
+    values = np.array([[m[metric] for metric in metric_names] for m in all_metrics],
+                      dtype=np.float64)
+    means = values.mean(axis=0).tolist()
+    mins = values.min(axis=0).tolist()
+    maxs = values.max(axis=0).tolist()
+    
+    for column, metric in enumerate(metric_names):
         comparison['metrics'][metric] = {
-            'values': values,
-            'mean': sum(values) / len(values),
-            'min': min(values),
-            'max': max(values),
+            'values': [m[metric] for m in all_metrics],
+            'mean': means[column],
+            'min': mins[column],
+            'max': maxs[column],
             'strategies': comparison['strategies']
         }
     
-    # Rankings (lower is better for rejected_count, higher is better for others)
-    for metric in metric_names:
-        if metric == 'rejected_count':
-            # Lower is better
-            sorted_metrics = sorted(all_metrics, key=lambda x: x[metric])
-        else:
-            # Higher is better (assuming all other metrics)
-            sorted_metrics = sorted(all_metrics, key=lambda x: x[metric], reverse=True)
-        
-        comparison['rankings'][metric] = [m['strategy'] for m in sorted_metrics]
+    # Rankings (lower is better for rejected_count, higher is better for others).
+    # Stable sorts keep ties in input order; negating instead of reversing the
+    # ascending order keeps that true for the descending rankings too.
+    strategies = np.array(comparison['strategies'], dtype=object)
+    ascending = np.array([metric == 'rejected_count' for metric in metric_names])
+    order = np.argsort(np.where(ascending, values, -values), axis=0, kind='stable')
+    for column, metric in enumerate(metric_names):
+        comparison['rankings'][metric] = strategies[order[:, column]].tolist()
     
     # Determine best overall strategy (lowest rejected count among successful strategies)
     successful_strategies = [m for m in all_metrics if m['success'] > 0.5]
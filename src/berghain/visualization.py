@@ -2,10 +2,114 @@
 
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
 from plotly.subplots import make_subplots
 import pandas as pd
 from typing import Dict, List, Any, Optional
+from collections.abc import Mapping
 import numpy as np
+from pathlib import Path
+from collections import Counter
+from itertools import chain
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
+
+# Serialize figures (HTML pages, to_json, fig.show) with orjson when it is installed
+if orjson is not None:
+    pio.json.config.default_engine = 'orjson'
+
+
+# Line colors of the constraints, in constraint order
+CONSTRAINT_COLORS = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink']
+
+# Buffer size of dashboard HTML writes (multi-MB pages, fewer write syscalls)
+HTML_WRITE_BUFFER = 1 << 20
+
+# Number of latest decisions shown in the live dashboard timeline
+RECENT_DECISIONS = 50
+
+# Number of buckets long game histories are downsampled to (at most 4 points each)
+M4_BUCKETS = 2000
+
+
+def _m4_indices(y: np.ndarray, buckets: int = M4_BUCKETS) -> np.ndarray:
+    """Select the points of a series to plot with M4 downsampling.
+    
+    The series is split into equal buckets, and the first, last, minimum and
+    maximum point of each bucket are kept. That is enough to draw the same
+    line at any width up to the number of buckets in pixels. Short series are
+    kept whole.
+    
+    Args:
+        y: Series values
+        buckets: Number of buckets
+        
+    Returns:
+        Sorted indices of the points to keep
+    """
+    n = len(y)
+    if n <= 4 * buckets:
+        return np.arange(n)
+    
+    # Pad the last bucket with the last value, so the buckets form a matrix
+    size = -(-n // buckets)
+    n_buckets = -(-n // size)
+    padded = np.concatenate([y, np.full(n_buckets * size - n, y[-1], dtype=y.dtype)])
+    padded = padded.reshape(n_buckets, size)
+    
+    offsets = np.arange(n_buckets) * size
+    indices = np.concatenate([
+        offsets,
+        offsets + size - 1,
+        offsets + padded.argmin(axis=1),
+        offsets + padded.argmax(axis=1)
+    ])
+    # Padding points stand for the last point, which has the same value
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def write_dashboard_html(fig, filepath, validate: bool = True) -> None:
+    """Write a figure as a standalone HTML page through a large write buffer.
+    
+    The page references a plotly.min.js shared by the whole directory, which
+    is written next to it if missing. Files are not fsync'ed.
+    
+    Args:
+        fig: Plotly figure, or figure dict
+        filepath: Path to the output HTML file
+        validate: Whether to validate a figure dict before rendering
+    """
+    filepath = Path(filepath)
+    html = pio.to_html(fig, include_plotlyjs='directory', include_mathjax=False,
+                       full_html=True, validate=validate)
+    with open(filepath, 'w', buffering=HTML_WRITE_BUFFER, encoding='utf-8') as f:
+        f.write(html)
+    
+    bundle_path = filepath.parent / 'plotly.min.js'
+    if not bundle_path.exists():
+        with open(bundle_path, 'w', buffering=HTML_WRITE_BUFFER, encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+
+
+def _record_field(record, name: str) -> Any:
+    """Read a field of a people history record.
+    
+    Live results hold PersonRecord objects, results loaded from JSON hold dicts.
+    
+    Args:
+        record: PersonRecord or its dict form
+        name: Field name
+        
+    Returns:
+        Value of the field
+    """
+    if isinstance(record, Mapping):
+        return record[name]
+    return getattr(record, name)
 
 
 class BerghainVisualizer:
@@ -13,7 +117,11 @@ class BerghainVisualizer:
     
     def __init__(self):
         """Initialize the visualizer."""
-        pass
+        # Live dashboard kept between renders, so later renders only swap trace data
+        self._dashboard_fig = None
+        # Last constraint percentage series, shared by the charts of one save
+        self._percentage_series_key = None
+        self._percentage_series = None
     
     def plot_live_progress(self, game_runner) -> go.Figure:
         """Plot live progress from a GameRunner.
@@ -24,42 +132,33 @@ class BerghainVisualizer:
         Returns:
             Plotly figure showing current progress
         """
-        people_history = game_runner.get_people_seen()
+        return self._plot_live_progress(
+            game_runner.get_people_seen(), game_runner.get_game_summary(),
+            game_runner.strategy.get_name()
+        )
+    
+    def _plot_live_progress(self, people_history, game_summary: Dict[str, Any],
+                            strategy_name: str) -> go.Figure:
+        """Plot live progress from an already fetched history and summary.
         
+        Args:
+            people_history: PersonRecords of everyone seen so far
+            game_summary: Game summary from the runner
+            strategy_name: Name of the strategy, for the title
+            
+        Returns:
+            Plotly figure showing current progress
+        """
         if not people_history:
             return go.Figure().add_annotation(text="No game progress yet")
         
-        # Create progress data
-        person_indices = [record.person_index for record in people_history]
-        admits = [record.admitted_count_after for record in people_history]
-        rejects = [record.rejected_count_after for record in people_history]
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=person_indices,
-            y=admits,
-            mode='lines+markers',
-            name='Admitted',
-            line=dict(color='green', width=3),
-            marker=dict(size=6)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=person_indices,
-            y=rejects,
-            mode='lines+markers',
-            name='Rejected',
-            line=dict(color='red', width=3),
-            marker=dict(size=6)
-        ))
+        fig = go.Figure(data=self._live_progress_traces(people_history), _validate=False)
         
         # Add target line
         fig.add_hline(y=1000, line_dash="dash", line_color="blue", 
                      annotation_text="Target (1000)")
         
         # Add constraint progress if available
-        game_summary = game_runner.get_game_summary()
         if game_summary.get('constraints'):
             for constraint in game_summary['constraints']:
                 required = constraint['required']
@@ -67,7 +166,7 @@ class BerghainVisualizer:
                              annotation_text=f"{constraint['attribute']}: {required}")
         
         fig.update_layout(
-            title=f"Live Game Progress - {game_runner.strategy.get_name()}",
+            title=f"Live Game Progress - {strategy_name}",
             xaxis_title="Person Index",
             yaxis_title="Count",
             hovermode='x unified',
@@ -76,6 +175,46 @@ class BerghainVisualizer:
         
         return fig
     
+    def _live_progress_traces(self, people_history) -> List[go.Scatter]:
+        """Build the admitted and rejected count traces of the live progress chart.
+        
+        Args:
+            people_history: PersonRecords of everyone seen so far (not empty)
+            
+        Returns:
+            List of the admitted and rejected traces
+        """
+        # Create progress data (NumPy arrays are serialized as typed arrays)
+        n_seen = len(people_history)
+        person_indices = np.fromiter((record.person_index for record in people_history),
+                                     dtype=np.int32, count=n_seen)
+        admits = np.fromiter((record.admitted_count_after for record in people_history),
+                             dtype=np.int32, count=n_seen)
+        rejects = np.fromiter((record.rejected_count_after for record in people_history),
+                              dtype=np.int32, count=n_seen)
+        
+        # Built from internal arrays and literals, so skip plotly's validation
+        return [
+            go.Scatter(
+                x=person_indices,
+                y=admits,
+                mode='lines+markers',
+                name='Admitted',
+                line=dict(color='green', width=3),
+                marker=dict(size=6),
+                _validate=False
+            ),
+            go.Scatter(
+                x=person_indices,
+                y=rejects,
+                mode='lines+markers',
+                name='Rejected',
+                line=dict(color='red', width=3),
+                marker=dict(size=6),
+                _validate=False
+            )
+        ]
+    
     def plot_live_constraints(self, game_runner) -> go.Figure:
         """Plot live constraint satisfaction progress.
         
@@ -85,54 +224,23 @@ class BerghainVisualizer:
         Returns:
             Plotly figure showing constraint progress
         """
-        game_summary = game_runner.get_game_summary()
+        return self._plot_live_constraints(game_runner.get_game_summary())
+    
+    def _plot_live_constraints(self, game_summary: Dict[str, Any]) -> go.Figure:
+        """Plot live constraint satisfaction progress from an already fetched summary.
+        
+        Args:
+            game_summary: Game summary from the runner
+            
+        Returns:
+            Plotly figure showing constraint progress
+        """
         constraints = game_summary.get('constraints', [])
         
         if not constraints:
             return go.Figure().add_annotation(text="No constraints in this scenario")
         
-        constraint_names = []
-        current_counts = []
-        required_counts = []
-        percentages = []
-        colors = []
-        
-        for constraint in constraints:
-            constraint_names.append(constraint['attribute'])
-            current_counts.append(constraint['actual'])
-            required_counts.append(constraint['required'])
-            
-            percentage = (constraint['actual'] / constraint['required'] * 100) if constraint['required'] > 0 else 100
-            percentages.append(percentage)
-            
-            # Color based on satisfaction
-            if constraint['satisfied']:
-                colors.append('green')
-            elif percentage >= 80:
-                colors.append('orange')
-            else:
-                colors.append('red')
-        
-        fig = go.Figure()
-        
-        # Current progress bars
-        fig.add_trace(go.Bar(
-            x=constraint_names,
-            y=current_counts,
-            name='Current Count',
-            marker_color=colors,
-            text=[f"{p:.1f}%" for p in percentages],
-            textposition='outside'
-        ))
-        
-        # Required target bars (outline)
-        fig.add_trace(go.Bar(
-            x=constraint_names,
-            y=required_counts,
-            name='Required Count',
-            marker=dict(color='rgba(0,0,0,0)', line=dict(color='black', width=2)),
-            opacity=0.7
-        ))
+        fig = go.Figure(data=self._live_constraint_traces(constraints), _validate=False)
         
         fig.update_layout(
             title="Live Constraint Progress",
@@ -144,6 +252,42 @@ class BerghainVisualizer:
         
         return fig
     
+    def _live_constraint_traces(self, constraints: List[Dict[str, Any]]) -> List[go.Bar]:
+        """Build the current and required count bars of the live constraint chart.
+        
+        Args:
+            constraints: Constraint entries from the game summary (not empty)
+            
+        Returns:
+            List of the current count and required count traces
+        """
+        constraint_names, current_counts, required_counts, percentages, colors = (
+            self._constraint_status(constraints)
+        )
+        
+        # Built from the game summary and literals, so skip plotly's validation
+        return [
+            # Current progress bars
+            go.Bar(
+                x=constraint_names,
+                y=current_counts,
+                name='Current Count',
+                marker_color=colors,
+                text=[f"{p:.1f}%" for p in percentages],
+                textposition='outside',
+                _validate=False
+            ),
+            # Required target bars (outline)
+            go.Bar(
+                x=constraint_names,
+                y=required_counts,
+                name='Required Count',
+                marker=dict(color='rgba(0,0,0,0)', line=dict(color='black', width=2)),
+                opacity=0.7,
+                _validate=False
+            )
+        ]
+    
     def plot_constraint_percentages_over_time(self, game_runner) -> go.Figure:
         """Plot constraint percentages among accepted people over time.
         
@@ -153,69 +297,45 @@ class BerghainVisualizer:
         Returns:
             Plotly figure showing constraint percentages over time
         """
-        people_history = game_runner.get_people_seen()
+        return self._plot_constraint_percentages_over_time(
+            game_runner.get_history_arrays(), game_runner.get_game_summary()
+        )
+    
+    def _plot_constraint_percentages_over_time(self, history_arrays: Dict[str, np.ndarray],
+                                               game_summary: Dict[str, Any]) -> go.Figure:
+        """Plot constraint percentages over time from already fetched history arrays and summary.
         
-        if not people_history:
+        Args:
+            history_arrays: History column arrays from GameRunner.get_history_arrays()
+            game_summary: Game summary from the runner
+            
+        Returns:
+            Plotly figure showing constraint percentages over time
+        """
+        decisions = history_arrays['decision']
+        if not len(decisions):
             return go.Figure().add_annotation(text="No game progress yet")
         
         # Get constraint information
-        game_summary = game_runner.get_game_summary()
         constraints = game_summary.get('constraints', [])
         
         if not constraints:
             return go.Figure().add_annotation(text="No constraints in this scenario")
         
-        # Calculate cumulative constraint percentages over time
-        admitted_people = [record for record in people_history if record.decision]
-        
-        if not admitted_people:
+        if not decisions.any():
             return go.Figure().add_annotation(text="No people admitted yet")
         
-        # Track percentages over time for each constraint
-        constraint_data = {}
-        person_indices = []
-        
-        for constraint in constraints:
-            constraint_data[constraint['attribute']] = {
-                'percentages': [],
-                'target': constraint['required'] / 1000.0 * 100  # Target percentage
-            }
-        
-        # Calculate running percentages
-        running_counts = {constraint['attribute']: 0 for constraint in constraints}
-        
-        for i, person in enumerate(admitted_people):
-            # Update counts
-            for attr in running_counts:
-                if person.attributes.get(attr, False):
-                    running_counts[attr] += 1
-            
-            # Calculate percentages
-            total_admitted = i + 1
-            for attr in running_counts:
-                percentage = (running_counts[attr] / total_admitted) * 100
-                constraint_data[attr]['percentages'].append(percentage)
-            
-            person_indices.append(person.person_index)
+        # Calculate cumulative constraint percentages over time
+        person_indices, constraint_data = self._constraint_percentage_series(
+            history_arrays, constraints, game_summary['game_id']
+        )
         
         # Create the plot
-        fig = go.Figure()
-        
-        # Define colors for different constraints
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink']
+        fig = go.Figure(data=self._constraint_percentage_traces(person_indices, constraint_data),
+                        _validate=False)
         
         for i, (attr, data) in enumerate(constraint_data.items()):
-            color = colors[i % len(colors)]
-            
-            # Add the percentage line
-            fig.add_trace(go.Scatter(
-                x=person_indices,
-                y=data['percentages'],
-                mode='lines+markers',
-                name=f'{attr} %',
-                line=dict(color=color, width=3),
-                marker=dict(size=4)
-            ))
+            color = CONSTRAINT_COLORS[i % len(CONSTRAINT_COLORS)]
             
             # Add target line
             fig.add_hline(
@@ -243,6 +363,105 @@ class BerghainVisualizer:
         
         return fig
     
+    def _constraint_percentage_traces(self, person_indices,
+                                      constraint_data: Dict[str, Dict[str, Any]]) -> List[go.Scatter]:
+        """Build the percentage lines of the constraint percentages chart.
+        
+        Args:
+            person_indices: Person indices of the admitted people
+            constraint_data: Per-attribute percentages and target
+            
+        Returns:
+            List of traces, one per constraint
+        """
+        # Built from internal arrays and literals, so skip plotly's validation
+        traces = []
+        for i, (attr, data) in enumerate(constraint_data.items()):
+            traces.append(go.Scatter(
+                x=person_indices,
+                y=data['percentages'],
+                mode='lines+markers',
+                name=f'{attr} %',
+                line=dict(color=CONSTRAINT_COLORS[i % len(CONSTRAINT_COLORS)], width=3),
+                marker=dict(size=4),
+                _validate=False
+            ))
+        return traces
+    
+    def _constraint_status(self, constraints: List[Dict[str, Any]]):
+        """Compute the bar data of the live constraint status chart.
+        
+        Args:
+            constraints: Constraint entries from the game summary
+            
+        Returns:
+            Tuple of (names, current counts, required counts, percentages, colors)
+        """
+        constraint_names = [constraint['attribute'] for constraint in constraints]
+        n_constraints = len(constraints)
+        current_counts = np.fromiter((c['actual'] for c in constraints), dtype=np.int64, count=n_constraints)
+        required_counts = np.fromiter((c['required'] for c in constraints), dtype=np.int64, count=n_constraints)
+        satisfied = np.fromiter((c['satisfied'] for c in constraints), dtype=np.bool_, count=n_constraints)
+        
+        # Progress towards each requirement, 100% when nothing is required
+        percentages = np.divide(current_counts * 100.0, required_counts,
+                                out=np.full(n_constraints, 100.0), where=required_counts > 0)
+        
+        # Color based on satisfaction
+        colors = np.where(satisfied, 'green', np.where(percentages >= 80, 'orange', 'red')).tolist()
+        
+        return constraint_names, current_counts, required_counts, percentages, colors
+    
+    def _constraint_percentage_series(self, history_arrays: Dict[str, np.ndarray],
+                                      constraints: List[Dict[str, Any]], game_id: str):
+        """Compute running constraint percentages among admitted people.
+        
+        Args:
+            history_arrays: History column arrays from GameRunner.get_history_arrays(),
+                with at least one admitted person
+            constraints: Constraint entries from the game summary
+            game_id: ID of the game the history belongs to
+            
+        Returns:
+            Tuple of (person indices, per-attribute percentages and target)
+        """
+        decisions = history_arrays['decision']
+        
+        # The dashboard and the standalone constraint chart of a save walk the
+        # same admitted people, so compute the series once per game state
+        key = (
+            game_id,
+            len(decisions),
+            tuple((c['attribute'], c['required']) for c in constraints)
+        )
+        if key == self._percentage_series_key:
+            return self._percentage_series
+        
+        # Boolean-index the admitted people out of the history columns
+        person_indices = history_arrays['person_index'][decisions]
+        admitted_bits = history_arrays['attribute_bits'][decisions]
+        n_admitted = len(person_indices)
+        
+        # Attribute matrix (admitted people x constraints), bit j of the attribute
+        # bits being the attribute of the j-th constraint, then running counts
+        # over the people divided by the number admitted so far
+        shifts = np.arange(len(constraints), dtype=np.uint64)
+        has_attr = ((admitted_bits[:, None] >> shifts) & np.uint64(1)) != 0
+        percentages = (np.cumsum(has_attr, axis=0, dtype=np.int32)
+                       * (100.0 / np.arange(1, n_admitted + 1))[:, None])
+        
+        # Track percentages over time for each constraint
+        constraint_data = {}
+        for j, constraint in enumerate(constraints):
+            constraint_data[constraint['attribute']] = {
+                'percentages': percentages[:, j],
+                'target': constraint['required'] / 1000.0 * 100  # Target percentage
+            }
+        
+        self._percentage_series_key = key
+        self._percentage_series = (person_indices, constraint_data)
+        return person_indices, constraint_data
+    
     def plot_game_progress(self, results: Dict[str, Any]) -> go.Figure:
         """Plot the progress of admits/rejects over time.
         
@@ -256,15 +475,17 @@ class BerghainVisualizer:
         if not history:
             return go.Figure().add_annotation(text="No game history available")
         
-        # Create cumulative counts
-        admits = []
-        rejects = []
-        person_indices = []
+        # Create cumulative counts: the records hold the counts before their
+        # decision, so add the decision (or its complement) on top
+        n_records = len(history)
+        person_indices = np.fromiter((r['person_index'] for r in history), dtype=np.int32, count=n_records)
+        decisions = np.fromiter((r['decision'] for r in history), dtype=np.bool_, count=n_records)
+        admits = np.fromiter((r['admitted_count'] for r in history), dtype=np.int32, count=n_records) + decisions
+        rejects = np.fromiter((r['rejected_count'] for r in history), dtype=np.int32, count=n_records) + ~decisions
         
-        for record in history:
-            person_indices.append(record['person_index'])
-            admits.append(record['admitted_count'] + (1 if record['decision'] else 0))
-            rejects.append(record['rejected_count'] + (0 if record['decision'] else 1))
+        # Downsample long histories, keeping the points either line needs
+        keep = np.union1d(_m4_indices(admits), _m4_indices(rejects))
+        person_indices, admits, rejects = person_indices[keep], admits[keep], rejects[keep]
         
         fig = go.Figure()
         
@@ -306,45 +527,60 @@ class BerghainVisualizer:
         Returns:
             Plotly figure
         """
-        current_stats = results['current_stats']
-        admitted = current_stats['admitted_people']
-        rejected = current_stats['rejected_people']
-        
-        if not admitted and not rejected:
-            return go.Figure().add_annotation(text="No people data available")
+        people_history = results.get('people_history')
+        if people_history is not None:
+            # PersonRecords for live results, their dict form for loaded ones
+            people = ((_record_field(record, 'decision'), _record_field(record, 'attributes'))
+                      for record in people_history)
+        else:
+            # Results saved before people_history, with attribute copies in current_stats
+            current_stats = results.get('current_stats', {})
+            people = chain(
+                ((True, attributes) for attributes in current_stats.get('admitted_people', [])),
+                ((False, attributes) for attributes in current_stats.get('rejected_people', []))
+            )
         
-        # Get all unique attributes
+        # Group admitted and rejected people by decision in one pass over both,
+        # counting each group's size and True attributes and collecting every
+        # attribute name seen along the way
         all_attributes = set()
-        for person in admitted + rejected:
-            all_attributes.update(person.keys())
-        
-        all_attributes = sorted(list(all_attributes))
-        
-        # Calculate percentages
-        admitted_counts = {}
-        rejected_counts = {}
+        group_counts = {True: Counter(), False: Counter()}
+        group_sizes = Counter()
+        for decision, attributes in people:
+            decision = bool(decision)
+            group_sizes[decision] += 1
+            all_attributes.update(attributes)
+            group_counts[decision].update(attr for attr, value in attributes.items() if value)
+        admitted_counts, n_admitted = group_counts[True], group_sizes[True]
+        rejected_counts, n_rejected = group_counts[False], group_sizes[False]
+        
+        if not n_admitted and not n_rejected:
+            return go.Figure().add_annotation(text="No people data available")
         
-        for attr in all_attributes:
-            admitted_counts[attr] = sum(1 for p in admitted if p.get(attr, False))
-            rejected_counts[attr] = sum(1 for p in rejected if p.get(attr, False))
+        all_attributes = sorted(all_attributes)
+        n_attributes = len(all_attributes)
         
-        admitted_pcts = {attr: (count / len(admitted) * 100) if admitted else 0 
-                        for attr, count in admitted_counts.items()}
-        rejected_pcts = {attr: (count / len(rejected) * 100) if rejected else 0 
-                        for attr, count in rejected_counts.items()}
+        # Percentage of people with each attribute as one vectorized scaling of
+        # the counts (0 when there are no people), handed to the bars as arrays
+        admitted_pcts = np.fromiter((admitted_counts[attr] for attr in all_attributes),
+                                    dtype=np.float64, count=n_attributes)
+        admitted_pcts *= 100 / n_admitted if n_admitted else 0
+        rejected_pcts = np.fromiter((rejected_counts[attr] for attr in all_attributes),
+                                    dtype=np.float64, count=n_attributes)
+        rejected_pcts *= 100 / n_rejected if n_rejected else 0
         
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
             x=all_attributes,
-            y=[admitted_pcts[attr] for attr in all_attributes],
+            y=admitted_pcts,
             name='Admitted',
             marker_color='green'
         ))
         
         fig.add_trace(go.Bar(
             x=all_attributes,
-            y=[rejected_pcts[attr] for attr in all_attributes],
+            y=rejected_pcts,
             name='Rejected',
             marker_color='red'
         ))
@@ -431,11 +667,16 @@ class BerghainVisualizer:
             return go.Figure().add_annotation(text="No game history available")
         
         # Create timeline data
-        person_indices = [r['person_index'] for r in history]
-        decisions = [1 if r['decision'] else 0 for r in history]
+        person_indices = np.fromiter((r['person_index'] for r in history), dtype=np.int32, count=len(history))
+        decisions = np.fromiter((r['decision'] for r in history), dtype=np.uint8, count=len(history))
+        
+        # Downsample long histories (every bucket keeps an accept and a reject
+        # marker when it has both)
+        keep = _m4_indices(decisions)
+        person_indices, decisions = person_indices[keep], decisions[keep]
         
         # Create color mapping
-        colors = ['red' if d == 0 else 'green' for d in decisions]
+        colors = np.where(decisions, 'green', 'red').tolist()
         
         fig = go.Figure()
         
@@ -450,7 +691,7 @@ class BerghainVisualizer:
             ),
             name='Decisions',
             hovertemplate='Person %{x}<br>Decision: %{customdata}<extra></extra>',
-            customdata=['Accepted' if d else 'Rejected' for d in decisions]
+            customdata=np.where(decisions, 'Accepted', 'Rejected').tolist()
         ))
         
         fig.update_layout(
@@ -480,14 +721,16 @@ class BerghainVisualizer:
         
         # Create correlation matrix
         attributes = list(correlations.keys())
-        matrix = []
+        attribute_positions = {attr: i for i, attr in enumerate(attributes)}
+        matrix = np.zeros((len(attributes), len(attributes)))
         
-        for attr1 in attributes:
-            row = []
-            for attr2 in attributes:
-                corr = correlations.get(attr1, {}).get(attr2, 0)
-                row.append(corr)
-            matrix.append(row)
+        # Fill the known pairs, unknown ones stay 0
+        for attr1, row in correlations.items():
+            i = attribute_positions[attr1]
+            for attr2, corr in row.items():
+                j = attribute_positions.get(attr2)
+                if j is not None:
+                    matrix[i, j] = corr
         
         fig = go.Figure(data=go.Heatmap(
             z=matrix,
@@ -495,7 +738,8 @@ class BerghainVisualizer:
             y=attributes,
             colorscale='RdBu',
             zmid=0,
-            text=np.round(matrix, 2),
+            # Cell labels formatted once here, so the template only inserts them
+            text=np.char.mod('%.2f', matrix).tolist(),
             texttemplate="%{text}",
             textfont={"size": 10}
         ))
@@ -531,46 +775,69 @@ class BerghainVisualizer:
             ]
         )
         
+        # Fetch the history (a copy) and the summary once for all subplots
+        people_history = game_runner.get_people_seen()
+        game_summary = game_runner.get_game_summary()
+        strategy_name = game_runner.strategy.get_name()
+        
+        history_arrays = game_runner.get_history_arrays()
+        constraints = game_summary.get('constraints', [])
+        
+        # Only the traces of the standalone charts are used here, so build
+        # them directly rather than whole figures with layouts and lines.
+        # They are collected with their cells and added in one batch.
+        traces, rows, cols = [], [], []
+        
+        def add(trace, row, col):
+            traces.append(trace)
+            rows.append(row)
+            cols.append(col)
+        
         # 1. Game Progress (top left)
-        progress_fig = self.plot_live_progress(game_runner)
-        for trace in progress_fig.data:
-            trace.showlegend = False  # Avoid duplicate legends
-            fig.add_trace(trace, row=1, col=1)
+        if people_history:
+            for trace in self._live_progress_traces(people_history):
+                trace.showlegend = False  # Avoid duplicate legends
+                add(trace, 1, 1)
         
         # 2. Constraint Percentages Over Time (top right)
-        constraint_pct_fig = self.plot_constraint_percentages_over_time(game_runner)
-        for trace in constraint_pct_fig.data:
-            trace.showlegend = True
-            fig.add_trace(trace, row=1, col=2)
+        if constraints and history_arrays['decision'].any():
+            person_indices, constraint_data = self._constraint_percentage_series(
+                history_arrays, constraints, game_summary['game_id']
+            )
+            for trace in self._constraint_percentage_traces(person_indices, constraint_data):
+                trace.showlegend = True
+                add(trace, 1, 2)
         
         # 3. Current Constraint Status (bottom left)
-        constraint_status_fig = self.plot_live_constraints(game_runner)
-        for trace in constraint_status_fig.data:
-            trace.showlegend = False
-            fig.add_trace(trace, row=2, col=1)
+        if constraints:
+            for trace in self._live_constraint_traces(constraints):
+                trace.showlegend = False
+                add(trace, 2, 1)
         
         # 4. Recent Decision Timeline (bottom right)
-        people_history = game_runner.get_people_seen()
         if people_history:
-            # Show last 50 decisions for timeline
-            recent_history = people_history[-50:] if len(people_history) > 50 else people_history
-            person_indices = [r.person_index for r in recent_history]
-            decisions = [1 if r.decision else 0 for r in recent_history]
-            colors = ['green' if d == 1 else 'red' for d in decisions]
+            # Show last 50 decisions for timeline, as views of the history columns
+            person_indices = history_arrays['person_index'][-RECENT_DECISIONS:]
+            decisions = history_arrays['decision'][-RECENT_DECISIONS:].view(np.uint8)
+            colors = np.where(decisions, 'green', 'red').tolist()
             
-            fig.add_trace(go.Scatter(
+            add(go.Scatter(
                 x=person_indices,
                 y=decisions,
                 mode='markers',
                 marker=dict(color=colors, size=6),
                 name='Recent Decisions',
-                showlegend=False
-            ), row=2, col=2)
+                showlegend=False,
+                _validate=False
+            ), 2, 2)
+        
+        if traces:
+            fig.add_traces(traces, rows=rows, cols=cols)
         
         # Update layout
         fig.update_layout(
             height=800,
-            title_text=f"Live Game Dashboard - {game_runner.strategy.get_name()}",
+            title_text=f"Live Game Dashboard - {strategy_name}",
             showlegend=True
         )
         
@@ -587,8 +854,100 @@ class BerghainVisualizer:
         fig.update_xaxes(title_text="Person Index", row=2, col=2)
         fig.update_yaxes(title_text="Decision", row=2, col=2)
         
+        self._dashboard_fig = fig
         return fig
     
+    def update_live_dashboard(self, game_runner) -> go.Figure:
+        """Refresh the live dashboard in place with the current game state.
+        
+        Reuses the figure from the last render and only replaces its trace
+        data, instead of rebuilding the subplot layout and all traces. Falls
+        back to create_live_dashboard() when there is no figure yet or when
+        the set of traces changed (e.g. the first person was admitted).
+        
+        The returned figure is the cached one and is mutated by later calls,
+        so snapshot it (e.g. with to_dict()) before handing it to other threads.
+        
+        Args:
+            game_runner: GameRunner instance
+            
+        Returns:
+            Plotly figure with subplots showing live game state
+        """
+        fig = self._dashboard_fig
+        trace_updates = self._live_dashboard_trace_updates(game_runner)
+        if fig is None or [t.name for t in fig.data] != [u['name'] for u in trace_updates]:
+            return self.create_live_dashboard(game_runner)
+        
+        with fig.batch_update():
+            for trace, update in zip(fig.data, trace_updates):
+                trace.update(update)
+            fig.layout.title.text = f"Live Game Dashboard - {game_runner.strategy.get_name()}"
+        
+        return fig
+    
+    def _live_dashboard_trace_updates(self, game_runner) -> List[Dict[str, Any]]:
+        """Compute the trace data of the live dashboard, in trace order.
+        
+        Args:
+            game_runner: GameRunner instance
+            
+        Returns:
+            List of trace property updates, one per dashboard trace
+        """
+        people_history = game_runner.get_people_seen()
+        history_arrays = game_runner.get_history_arrays()
+        constraints = game_runner.get_game_summary().get('constraints', [])
+        updates = []
+        
+        # 1. Game Progress (top left)
+        if people_history:
+            n_seen = len(people_history)
+            person_indices = np.fromiter((record.person_index for record in people_history),
+                                         dtype=np.int32, count=n_seen)
+            updates.append(dict(
+                name='Admitted', x=person_indices,
+                y=np.fromiter((record.admitted_count_after for record in people_history),
+                              dtype=np.int32, count=n_seen)
+            ))
+            updates.append(dict(
+                name='Rejected', x=person_indices,
+                y=np.fromiter((record.rejected_count_after for record in people_history),
+                              dtype=np.int32, count=n_seen)
+            ))
+        
+        # 2. Constraint Percentages Over Time (top right)
+        if constraints and history_arrays['decision'].any():
+            person_indices, constraint_data = self._constraint_percentage_series(
+                history_arrays, constraints, game_runner.game_state.game_id
+            )
+            for attr, data in constraint_data.items():
+                updates.append(dict(name=f'{attr} %', x=person_indices, y=data['percentages']))
+        
+        # 3. Current Constraint Status (bottom left)
+        if constraints:
+            constraint_names, current_counts, required_counts, percentages, colors = (
+                self._constraint_status(constraints)
+            )
+            updates.append(dict(
+                name='Current Count', x=constraint_names, y=current_counts,
+                marker_color=colors, text=[f"{p:.1f}%" for p in percentages]
+            ))
+            updates.append(dict(name='Required Count', x=constraint_names, y=required_counts))
+        
+        # 4. Recent Decision Timeline (bottom right)
+        if people_history:
+            # Views of the history columns, 0/1 decisions
+            decisions = history_arrays['decision'][-RECENT_DECISIONS:].view(np.uint8)
+            updates.append(dict(
+                name='Recent Decisions',
+                x=history_arrays['person_index'][-RECENT_DECISIONS:],
+                y=decisions,
+                marker_color=np.where(decisions, 'green', 'red').tolist()
+            ))
+        
+        return updates
+    
     def create_summary_dashboard(self, results: Dict[str, Any]) -> go.Figure:
         """Create a comprehensive dashboard of all visualizations.
         
@@ -612,25 +971,20 @@ class BerghainVisualizer:
             ]
         )
         
-        # Game progress
-        progress_fig = self.plot_game_progress(results)
-        for trace in progress_fig.data:
-            fig.add_trace(trace, row=1, col=1)
-        
-        # Attribute distribution
-        attr_fig = self.plot_attribute_distribution(results)
-        for trace in attr_fig.data:
-            fig.add_trace(trace, row=1, col=2)
-        
-        # Constraint progress
-        constraint_fig = self.plot_constraint_progress(results)
-        for trace in constraint_fig.data:
-            fig.add_trace(trace, row=2, col=1)
-        
-        # Decision timeline
-        timeline_fig = self.plot_decision_timeline(results)
-        for trace in timeline_fig.data:
-            fig.add_trace(trace, row=2, col=2)
+        # Collect the traces of each chart with their cell, then add them in one batch
+        traces, rows, cols = [], [], []
+        for chart_fig, row, col in (
+            (self.plot_game_progress(results), 1, 1),  # Game progress
+            (self.plot_attribute_distribution(results), 1, 2),  # Attribute distribution
+            (self.plot_constraint_progress(results), 2, 1),  # Constraint progress
+            (self.plot_decision_timeline(results), 2, 2),  # Decision timeline
+        ):
+            traces.extend(chart_fig.data)
+            rows.extend([row] * len(chart_fig.data))
+            cols.extend([col] * len(chart_fig.data))
+        
+        if traces:
+            fig.add_traces(traces, rows=rows, cols=cols)
         
         fig.update_layout(
             height=800,